@@ -106,7 +106,8 @@ odoo_router = APIRouter(
 async def odoo_login(credentials: OdooUserCredentials, response: Response):
     """Authenticate with Odoo and get JWT token with session cookie"""
     try:
-        # Create Odoo client and authenticate
+        # Create Odoo client and authenticate; the shared auth cache spares the
+        # Odoo RPC for a login checked in the last ODOO_AUTH_CACHE_TTL seconds
         logger.info(f"Attempting Odoo login : {credentials.odoo_username}")
         odoo_client = OdooClient(
             url=settings.ODOO_URL,
@@ -25,7 +25,7 @@ async def bulk_sync(
     request: BulkSyncRequest,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_odoo_session_user),
-    db_connection=Depends(db.connection),
+    db_connection=Depends(db.lazy_connection),
 ):
     """Bulk sync multiple entities with Odoo"""
     try:
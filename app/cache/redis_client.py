@@ -1,7 +1,7 @@
 """Redis client for caching and session management"""
 
 import json
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import redis.asyncio as redis
 import structlog
 
@@ -174,6 +174,59 @@ class RedisClient:
             logger.warning("Redis hdel failed", key=key, field=field, error=str(e))
             return False
 
+    async def get_hash_fields_many(
+        self, requests: List[Tuple[str, List[str]]]
+    ) -> List[dict]:
+        """Get several fields of several hashes in one round trip
+
+        Values are JSON decoded; fields that are not set are left out.
+        """
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, fields in requests:
+                    pipe.hmget(key, fields)
+                rows = await pipe.execute()
+            return [
+                {
+                    field: json.loads(value)
+                    for field, value in zip(fields, row)
+                    if value is not None
+                }
+                for (_, fields), row in zip(requests, rows)
+            ]
+        except Exception as e:
+            logger.warning("Redis hmget failed", count=len(requests), error=str(e))
+            return [{} for _ in requests]
+
+    async def set_hashes(self, mapping: Dict[str, dict], expire: int = 3600) -> bool:
+        """JSON encode and set fields of several hashes
+
+        The expiry is only set on hashes that have none (EXPIRE NX, Redis 7), so
+        adding fields never extends the life of those already there.
+        """
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, fields in mapping.items():
+                    pipe.hset(
+                        key,
+                        mapping={field: json.dumps(value) for field, value in fields.items()},
+                    )
+                    pipe.expire(key, expire, nx=True)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning("Redis hset failed", count=len(mapping), error=str(e))
+            return False
+
+    async def delete_many(self, *keys: str) -> bool:
+        """Delete several keys"""
+        try:
+            await self.client.delete(*keys)
+            return True
+        except Exception as e:
+            logger.warning("Redis delete failed", keys=keys, error=str(e))
+            return False
+
     async def add_to_set(self, key: str, value: str) -> bool:
         """Add value to set"""
         try:
@@ -41,6 +41,13 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
     POSTGRES_PORT: str
     POSTGRES_CONN_OPTION: dict
+    # Prepared statements asyncpg caches per database connection
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 128
+    # Read replicas for read-only queries, the replication lag (s) they may have,
+    # and how often (s) it is checked
+    POSTGRES_REPLICA_URIS: list = []
+    POSTGRES_REPLICA_MAX_LAG: float = 5.0
+    POSTGRES_REPLICA_CHECK_INTERVAL: float = 5.0
     DATABASE_URI: Optional[str] = None
 
     @property
@@ -61,6 +68,61 @@ class Settings(BaseSettings):
     # ODOO_WRITE_ENABLE: bool = False
     # ODOO_API_HEADER: str
     ODOO_API_KEY: str
+    ODOO_RPC_TIMEOUT: float = 120.0
+    ODOO_CONNECT_TIMEOUT: float = 5.0
+    # "xmlrpc" or "jsonrpc"
+    ODOO_TRANSPORT: str = Field(default="xmlrpc", env="ODOO_TRANSPORT")
+    # Keep-alive connections per Odoo host and their idle timeout in seconds
+    ODOO_POOL_SIZE: int = 20
+    ODOO_POOL_IDLE_TIMEOUT: float = 30.0
+    # Process-wide pool of authenticated Odoo clients (one per login)
+    ODOO_CLIENT_POOL_SIZE: int = 1000
+    ODOO_CLIENT_POOL_TTL: float = 1800.0
+    # Seconds an authenticated login's uid is cached in Redis; 0 disables
+    ODOO_AUTH_CACHE_TTL: int = 900
+    # Adaptive (AIMD) concurrency limit per Odoo endpoint
+    ODOO_LIMIT_INITIAL: int = 8
+    ODOO_LIMIT_MIN: int = 1
+    ODOO_LIMIT_MAX: int = 64
+    ODOO_LIMIT_LATENCY_TARGET: float = 2.0
+    ODOO_LIMIT_QUEUE_SIZE: int = 200
+    ODOO_LIMIT_QUEUE_TIMEOUT: float = 10.0
+    # Circuit breaker per Odoo endpoint
+    ODOO_BREAKER_FAILURE_THRESHOLD: int = 5
+    ODOO_BREAKER_RESET_TIMEOUT: float = 30.0
+    # Seconds cached fields_get metadata is trusted before a refresh, and how
+    # many (user, model) entries are kept
+    ODOO_FIELDS_CACHE_TTL: float = 3600.0
+    ODOO_FIELDS_CACHE_SIZE: int = 2000
+    # Query result cache lifetime in seconds, overridable per model; 0 disables
+    ODOO_QUERY_CACHE_TTL: int = 300
+    ODOO_QUERY_CACHE_MODEL_TTLS: dict = {}
+    # Per-record cache lifetime in seconds (0 disables), and for ids found missing
+    ODOO_RECORD_CACHE_TTL: int = 600
+    ODOO_RECORD_MISSING_TTL: int = 60
+    # Window in seconds for coalescing writes (0 disables), and max records per batch
+    ODOO_WRITE_BATCH_WINDOW: float = 0.02
+    ODOO_WRITE_BATCH_MAX: int = 500
+    # Page size for streamed (keyset-paginated) Odoo reads
+    ODOO_CHUNK_SIZE: int = 1000
+    # Max serialized size in bytes of one bulk create call
+    ODOO_CREATE_CHUNK_BYTES: int = 1_000_000
+    # Concurrent id-range shards for full reloads of big models
+    ODOO_BULK_READ_WORKERS: int = 4
+    # Independent Odoo sub-queries a single API request may run at once
+    ODOO_REQUEST_CONCURRENCY: int = 4
+    # Endpoints served straight from the Odoo database instead of XML-RPC, and
+    # the language of translated names. Opt-in: these reads skip Odoo record
+    # rules, so every API user sees every project and task
+    ODOO_SQL_READ_ENDPOINTS: list = []
+    ODOO_DB_LANG: str = "en_US"
+    # Local mirror of Odoo models (app.mirror.worker): target database (required
+    # by the worker, and not Odoo's), seconds between delta runs and between id
+    # reconciliations, and how far (s) the write_date watermark trails
+    MIRROR_DATABASE_URI: Optional[str] = None
+    MIRROR_INTERVAL: float = 60.0
+    MIRROR_RECONCILE_INTERVAL: float = 3600.0
+    MIRROR_OVERLAP: float = 300.0
 
     ODOO_JWT_AUTHZ_HOST: str
     ODOO_JWT_AUTHZ_LOGIN_EP: str
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import time
 import typing
+from contextlib import asynccontextmanager
 
 import asyncpg
 from fastapi import FastAPI
@@ -9,6 +11,167 @@ from .logger import DEBUG_QUALNAME
 _logger = logging.getLogger(DEBUG_QUALNAME)
 
 
+class PoolWaitStats:
+    """Time spent waiting for, and holding, pooled connections"""
+
+    def __init__(self):
+        self.acquired = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.held_total = 0.0
+
+    async def acquire(self, pool):
+        started = time.monotonic()
+        conn = await pool.acquire()
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+        return conn, time.monotonic()
+
+    def released(self, acquired_at: float):
+        self.held_total += time.monotonic() - acquired_at
+
+    def stats(self) -> dict:
+        return {
+            "acquired": self.acquired,
+            "wait_avg_ms": round(self.wait_total / self.acquired * 1000, 3)
+            if self.acquired
+            else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+            "held_avg_ms": round(self.held_total / self.acquired * 1000, 3)
+            if self.acquired
+            else 0.0,
+        }
+
+
+class LazyConnection:
+    """Connection stand-in that checks out a pooled connection on first use
+
+    Query methods acquire a connection, run, and give it back to the pool as
+    soon as no transaction or `hold()` block needs it any more, so a request
+    waiting on Odoo does not keep a connection checked out. Concurrent use
+    shares one connection, and its queries run one at a time, as asyncpg
+    requires.
+    """
+
+    def __init__(self, pool, wait_stats: PoolWaitStats):
+        # A pool, or a callable choosing one when a connection is needed
+        self._pool = pool
+        self._wait_stats = wait_stats
+        self._conn = None
+        self._conn_pool = None
+        self._acquired_at = 0.0
+        self._holders = 0
+        self._acquiring = asyncio.Lock()
+        self._busy = asyncio.Lock()
+
+    @asynccontextmanager
+    async def hold(self):
+        """The underlying connection, kept checked out for the block"""
+        self._holders += 1
+        try:
+            if self._conn is None:
+                async with self._acquiring:
+                    # Another holder may have acquired it while we waited
+                    if self._conn is None:
+                        pool = self._pool() if callable(self._pool) else self._pool
+                        self._conn, self._acquired_at = await self._wait_stats.acquire(pool)
+                        self._conn_pool = pool
+            yield self._conn
+        finally:
+            self._holders -= 1
+            if (
+                not self._holders
+                and self._conn is not None
+                and not self._conn.is_in_transaction()
+            ):
+                await self.release()
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Keep the connection checked out and inside a transaction for the block"""
+        async with self.hold() as conn:
+            async with self._busy:
+                tx = conn.transaction()
+                await tx.start()
+            try:
+                yield self
+            except BaseException:
+                async with self._busy:
+                    await tx.rollback()
+                raise
+            async with self._busy:
+                await tx.commit()
+
+    async def release(self):
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._wait_stats.released(self._acquired_at)
+            await self._conn_pool.release(conn)
+
+    async def fetch(self, query: str, *args, **kwargs):
+        async with self.hold() as conn, self._busy:
+            return await conn.fetch(query, *args, **kwargs)
+
+    async def fetchrow(self, query: str, *args, **kwargs):
+        async with self.hold() as conn, self._busy:
+            return await conn.fetchrow(query, *args, **kwargs)
+
+    async def fetchval(self, query: str, *args, **kwargs):
+        async with self.hold() as conn, self._busy:
+            return await conn.fetchval(query, *args, **kwargs)
+
+    async def execute(self, query: str, *args, **kwargs):
+        async with self.hold() as conn, self._busy:
+            return await conn.execute(query, *args, **kwargs)
+
+    async def executemany(self, command: str, args, **kwargs):
+        async with self.hold() as conn, self._busy:
+            return await conn.executemany(command, args, **kwargs)
+
+
+# Seconds the replica is behind; 0 when it is streaming and has replayed all WAL
+# it received. A disconnected WAL receiver freezes both LSNs at the same point,
+# so without a streaming receiver the lag is the age of the last replayed
+# transaction, or NULL (unknown) if there is none. Reading the receiver's status
+# needs pg_read_all_stats; without it the age is always used.
+REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            AND EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming')
+            THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+class ReplicaPool:
+    """A read replica's pool, with its last measured replication lag"""
+
+    def __init__(self, dsn: str, pool):
+        self.dsn = dsn
+        self.pool = pool
+        self.lag = 0.0
+        self.healthy = True
+
+    @property
+    def busy(self) -> float:
+        """Share of the pool's connections checked out"""
+        in_use = self.pool.get_size() - self.pool.get_idle_size()
+        return in_use / self.pool.get_max_size()
+
+    def stats(self) -> dict:
+        return {
+            # Host part only: the DSN may hold a password
+            "host": self.dsn.rsplit("@", 1)[-1],
+            "healthy": self.healthy,
+            "lag": round(self.lag, 3) if self.lag != float("inf") else None,
+            "busy": round(self.busy, 3),
+        }
+
+
 class ConfigureAsyncpg:
     def __init__(
         self,
@@ -18,6 +181,9 @@ class ConfigureAsyncpg:
         *,
         init_db: typing.Callable = None,  # callable for running sql on init
         pool=None,  # usable on testing
+        replica_dsns: typing.Sequence[str] = (),
+        max_replica_lag: float = 5.0,
+        lag_check_interval: float = 5.0,
         **options,
     ):
         """This is the entry point to configure an asyncpg pool with fastapi.
@@ -30,6 +196,9 @@ class ConfigureAsyncpg:
                 for doing an initialitzation of it
             pool: This is used for testing to skip the pool initialitzation
                 an just use the SingleConnectionTestingPool
+            replica_dsns: DSNs of read replicas; read dependencies use the
+                least busy one whose lag is under max_replica_lag seconds
+                (checked every lag_check_interval), else the primary
             **options: connection options to directly pass to asyncpg driver
                 see: https://magicstack.github.io/asyncpg/current/api/index.html#connection-pools
         """
@@ -39,6 +208,12 @@ class ConfigureAsyncpg:
         self.con_opts = options
         self._pool = pool
         self._db_code = db_code
+        self.wait_stats = PoolWaitStats()
+        self.replica_dsns = list(replica_dsns)
+        self.max_replica_lag = max_replica_lag
+        self.lag_check_interval = lag_check_interval
+        self.replicas: typing.List[ReplicaPool] = []
+        self._lag_watcher = None
         self.app.router.add_event_handler("startup", self.on_connect)
         self.app.router.add_event_handler("shutdown", self.on_disconnect)
 
@@ -55,13 +230,47 @@ class ConfigureAsyncpg:
                 await self.init_db(db)
         setattr(self.app.state, self._db_code, pool)
 
+        for dsn in self.replica_dsns:
+            try:
+                replica = ReplicaPool(dsn, await asyncpg.create_pool(dsn=dsn, **self.con_opts))
+            except Exception as err:
+                # Reads fall back to the primary; a broken replica must not
+                # stop the application from starting
+                _logger.warning("Read replica unavailable, skipped: %s", err)
+                continue
+            self.replicas.append(replica)
+        if self.replicas:
+            self._lag_watcher = asyncio.ensure_future(self._watch_replicas())
+
     async def on_disconnect(self):
+        if self._lag_watcher is not None:
+            self._lag_watcher.cancel()
+        for replica in self.replicas:
+            await replica.pool.close()
+        self.replicas = []
         # if the pool is comming from outside, don't desconnect it
         # someone else will do (usualy a pytest fixture)
         if self._pool:
             return
         await getattr(self.app.state, self._db_code).close()
 
+    async def check_replica(self, replica: ReplicaPool):
+        """Measure a replica's lag; unreachable replicas are taken out of rotation"""
+        try:
+            async with replica.pool.acquire() as db:
+                lag = await db.fetchval(REPLICA_LAG_QUERY)
+            # Unknown lag: keep the replica out of rotation
+            replica.lag = float("inf") if lag is None else float(lag)
+            replica.healthy = True
+        except Exception as err:
+            _logger.warning("Read replica check failed: %s", err)
+            replica.healthy = False
+
+    async def _watch_replicas(self):
+        while True:
+            await asyncio.gather(*(self.check_replica(r) for r in self.replicas))
+            await asyncio.sleep(self.lag_check_interval)
+
     def on_init(self, func):
         self.init_db = func
         return func
@@ -70,6 +279,20 @@ class ConfigureAsyncpg:
     def pool(self):
         return getattr(self.app.state, self._db_code)
 
+    def read_pool(self):
+        """Least busy healthy replica within the lag limit, else the primary"""
+        replicas = [
+            replica
+            for replica in self.replicas
+            if replica.healthy and replica.lag <= self.max_replica_lag
+        ]
+        if not replicas:
+            return self.pool
+        return min(replicas, key=lambda replica: replica.busy).pool
+
+    def replica_stats(self) -> typing.List[dict]:
+        return [replica.stats() for replica in self.replicas]
+
     async def connection(self):
         """
         A ready to use connection Dependency just usable
@@ -81,9 +304,44 @@ class ConfigureAsyncpg:
                 await db.fetch("SELECT * from pg_schemas")
         """
         _logger.debug("#CHK Before getting connection : %s", time.time())
-        async with self.pool.acquire() as db:
-            _logger.debug("#CHK After acquired connection : %s", time.time())
+        db, acquired_at = await self.wait_stats.acquire(self.pool)
+        _logger.debug("#CHK After acquired connection : %s", time.time())
+        try:
+            yield db
+        finally:
+            self.wait_stats.released(acquired_at)
+            await self.pool.release(db)
+
+    async def lazy_connection(self):
+        """
+        Like `connection`, but nothing is checked out of the pool until the
+        first query, and the connection goes back after each query (see
+        `LazyConnection`). Use it on paths that may not touch the database.
+        Example:
+            @app.get("/")
+            async def get_content(db = Depends(db.lazy_connection)):
+                await db.fetch("SELECT * from pg_schemas")
+        """
+        db = LazyConnection(self.pool, self.wait_stats)
+        try:
+            yield db
+        finally:
+            await db.release()
+
+    async def lazy_read_connection(self):
+        """
+        `lazy_connection` for read-only queries: the connection comes from a
+        replica (see `read_pool`) when one is configured and fresh enough.
+        Example:
+            @app.get("/")
+            async def get_content(db = Depends(db.lazy_read_connection)):
+                await db.fetch("SELECT * from pg_schemas")
+        """
+        db = LazyConnection(self.read_pool, self.wait_stats)
+        try:
             yield db
+        finally:
+            await db.release()
 
     async def transaction(self):
         """
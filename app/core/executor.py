@@ -1,4 +1,5 @@
 from typing import Tuple, Iterable
+
 import asyncpg
 
 
@@ -6,11 +7,16 @@ def build_query(query: str) -> str:
     return query % tuple(f"${a}" for a in range(1, query.count("%s") + 1))
 
 
+# `conn.fetch(query, ...)` goes through asyncpg's per-connection statement cache
+# (`statement_cache_size`, see POSTGRES_STATEMENT_CACHE_SIZE): a query is
+# prepared once per connection and reused across pool checkouts, and asyncpg
+# re-prepares it itself after schema changes. `conn.prepare()` bypasses that
+# cache and costs a Parse round trip on every call.
+
+
 async def prepare_and_fetch(conn: asyncpg.Connection, query: str, *args):
-    stmt = await conn.prepare(query)
-    return await stmt.fetch(*args)
+    return await conn.fetch(query, *args)
 
 
 async def prepare_and_fetchrow(conn: asyncpg.Connection, query: str, *args):
-    stmt = await conn.prepare(query)
-    return await stmt.fetchrow(*args)
+    return await conn.fetchrow(query, *args)
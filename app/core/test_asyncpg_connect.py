@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from app.core.asyncpg_connect import LazyConnection, PoolWaitStats
+
+
+class FakeTransaction:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def start(self):
+        self.conn.in_transaction = True
+
+    async def commit(self):
+        self.conn.in_transaction = False
+        self.conn.log.append("commit")
+
+    async def rollback(self):
+        self.conn.in_transaction = False
+        self.conn.log.append("rollback")
+
+
+class FakeConnection:
+    """Fails like asyncpg when two operations overlap"""
+
+    def __init__(self):
+        self.busy = False
+        self.in_transaction = False
+        self.log = []
+
+    async def fetch(self, query, *args):
+        if self.busy:
+            raise RuntimeError("another operation is in progress")
+        self.busy = True
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.busy = False
+        self.log.append(query)
+        return [query]
+
+    def is_in_transaction(self):
+        return self.in_transaction
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+
+class FakePool:
+    def __init__(self):
+        self.checked_out = 0
+        self.acquired = 0
+        self.conn = None
+
+    async def acquire(self):
+        await asyncio.sleep(0.01)
+        self.checked_out += 1
+        self.acquired += 1
+        self.conn = FakeConnection()
+        return self.conn
+
+    async def release(self, conn):
+        self.checked_out -= 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_connection_and_release_it():
+    pool = FakePool()
+    conn = LazyConnection(pool, PoolWaitStats())
+
+    results = await asyncio.gather(*(conn.fetch(f"SELECT {i}") for i in range(5)))
+    await conn.release()
+
+    assert results == [[f"SELECT {i}"] for i in range(5)]
+    assert pool.acquired == 1
+    assert pool.checked_out == 0
+
+
+@pytest.mark.asyncio
+async def test_transaction_keeps_the_connection_until_commit():
+    pool = FakePool()
+    conn = LazyConnection(pool, PoolWaitStats())
+
+    async with conn.transaction():
+        await asyncio.gather(conn.fetch("SELECT 1"), conn.fetch("SELECT 2"))
+        assert pool.checked_out == 1
+
+    assert pool.conn.log[-1] == "commit"
+    assert pool.acquired == 1
+    assert pool.checked_out == 0
+
+
+@pytest.mark.asyncio
+async def test_transaction_rolls_back_on_error():
+    pool = FakePool()
+    conn = LazyConnection(pool, PoolWaitStats())
+
+    with pytest.raises(ValueError):
+        async with conn.transaction():
+            await conn.fetch("SELECT 1")
+            raise ValueError("boom")
+
+    assert pool.conn.log[-1] == "rollback"
+    assert pool.checked_out == 0
@@ -1,6 +1,5 @@
 
 import logging
-from xmlrpc.client import ServerProxy
 from typing import Any, List, Dict
 from asyncpg import Connection
 from pydantic import BaseModel
@@ -12,6 +11,7 @@ from app.core.logger import logger
 
 # from odoo.core.exceptions import CustomHTTPException
 from app.odoo.client import session_odoo_client
+from app.odoo.transport import ServiceProxy, make_transport
 
 # _logger is now replaced by the simple logger instance
 
@@ -48,11 +48,14 @@ class ConfigureOdoo:
         self.app = app
         self.uid = None
         self.odoo_auth = odoo_auth
+        # Proxies share the pooled keep-alive connections to the Odoo host
+        transport = make_transport(odoo_auth.url)
+        self.common = ServiceProxy(transport, "common")
+        self.models = ServiceProxy(transport, "object")
         self.app.router.add_event_handler("startup", self._on_startup)
 
     async def _on_startup(self):
-        common = ServerProxy(f"{self.odoo_auth.url}/xmlrpc/2/common")
-        self.uid = common.authenticate(
+        self.uid = await self.common.authenticate(
             self.odoo_auth.database, self.odoo_auth.user, self.odoo_auth.password, {}
         )
         if not self.uid:
@@ -63,7 +66,7 @@ class ConfigureOdoo:
     async def connection(self):
         yield Odoo(
             secrets=(self.odoo_auth.database, self.uid, self.odoo_auth.password),
-            models=ServerProxy(f"{self.odoo_auth.url}/xmlrpc/2/object"),
+            models=self.models,
         )
 
 
@@ -10,6 +10,15 @@ from app import dependency
 from app.core.asyncpg_connect import ConfigureAsyncpg
 from app.core.logger import logger
 from app.dependency import OdooAuthRequirements, ConfigureOdoo, SessionOdooConnection
+from app.odoo.auth_cache import auth_cache
+from app.odoo.circuit_breaker import breaker_stats
+from app.odoo.client import odoo_pool
+from app.odoo.http_pool import odoo_http_pool
+from app.odoo.limiter import limiter_stats
+from app.odoo.query_cache import query_cache
+from app.odoo.record_store import record_store
+from app.odoo.singleflight import odoo_singleflight
+from app.odoo.write_batcher import write_batcher
 
 
 def create_app() -> FastAPI:
@@ -51,7 +60,7 @@ def create_app() -> FastAPI:
         logger.info("Application shutting down")
         # await close_db()
         # Close other connections
-        pass
+        await odoo_http_pool.close()
 
     # Health check endpoint
     @app.get("/health", tags=["health"])
@@ -62,6 +71,27 @@ def create_app() -> FastAPI:
             "debug": settings.DEBUG,
         }
 
+    @app.get("/health/db", tags=["health"])
+    async def db_health():
+        return {
+            "pool_wait": dependency.db.wait_stats.stats(),
+            "replicas": dependency.db.replica_stats(),
+        }
+
+    @app.get("/health/odoo", tags=["health"])
+    async def odoo_health():
+        return {
+            "http_pool": odoo_http_pool.stats(),
+            "client_pool": odoo_pool.stats(),
+            "auth_cache": auth_cache.stats(),
+            "limiter": limiter_stats(),
+            "circuit_breaker": breaker_stats(),
+            "singleflight": odoo_singleflight.stats(),
+            "query_cache": query_cache.stats(),
+            "record_store": record_store.stats(),
+            "write_batcher": write_batcher.stats(),
+        }
+
     # Root endpoint
     @app.get("/", tags=["root"])
     async def root():
@@ -81,7 +111,13 @@ dependency.db = ConfigureAsyncpg(
     app,
     settings.asyncpg_dsn,
     db_code=settings.POSTGRES_CODE,
-    **settings.POSTGRES_CONN_OPTION
+    replica_dsns=settings.POSTGRES_REPLICA_URIS,
+    max_replica_lag=settings.POSTGRES_REPLICA_MAX_LAG,
+    lag_check_interval=settings.POSTGRES_REPLICA_CHECK_INTERVAL,
+    **{
+        "statement_cache_size": settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        **settings.POSTGRES_CONN_OPTION,
+    }
 )
 odoo_auth_requirements = OdooAuthRequirements(
     url=settings.ODOO_URL,
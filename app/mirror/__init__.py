@@ -0,0 +1 @@
+"""Local PostgreSQL mirror of Odoo models"""
@@ -0,0 +1,295 @@
+"""Incremental delta sync of Odoo models into local PostgreSQL tables"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+ODOO_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+WATERMARK_TABLE = """
+    CREATE TABLE IF NOT EXISTS mirror_watermark (
+        model varchar PRIMARY KEY,
+        write_date timestamp NOT NULL,
+        synced_at timestamp,
+        reconciled_at timestamp
+    )
+"""
+
+WATERMARK_QUERY = """
+    SELECT write_date, reconciled_at FROM mirror_watermark WHERE model = $1
+"""
+
+SAVE_WATERMARK = """
+    INSERT INTO mirror_watermark (model, write_date, synced_at, reconciled_at)
+    VALUES ($1, $2, now() AT TIME ZONE 'UTC', now() AT TIME ZONE 'UTC')
+    ON CONFLICT (model) DO UPDATE SET
+        write_date = EXCLUDED.write_date,
+        synced_at = EXCLUDED.synced_at
+"""
+
+SAVE_RECONCILED = """
+    UPDATE mirror_watermark SET reconciled_at = now() AT TIME ZONE 'UTC' WHERE model = $1
+"""
+
+
+@dataclass
+class MirrorModel:
+    """An Odoo model mirrored into a local table
+
+    `columns` maps Odoo field names to PostgreSQL column types; many2one
+    fields are stored as their id and many2many fields as `integer[]`.
+    """
+
+    model: str
+    table: str
+    columns: Dict[str, str]
+    domain: List = field(default_factory=list)
+
+    @property
+    def fields(self) -> List[str]:
+        return ["id", "write_date"] + [
+            name for name in self.columns if name not in ("id", "write_date")
+        ]
+
+    def column_types(self) -> Dict[str, str]:
+        return {"id": "integer", "write_date": "timestamp", **self.columns}
+
+
+# Archived records still change; the domain keeps them visible so the mirror
+# sees them go inactive instead of losing them until the next reconciliation
+WITH_ARCHIVED = [("active", "in", [True, False])]
+
+DEFAULT_MODELS = [
+    MirrorModel(
+        "project.project",
+        "mirror_project_project",
+        {
+            "name": "varchar",
+            "active": "boolean",
+            "sequence": "integer",
+            "color": "integer",
+            "user_id": "integer",
+            "partner_id": "integer",
+            "allocated_hours": "double precision",
+            "tag_ids": "integer[]",
+        },
+        WITH_ARCHIVED,
+    ),
+    MirrorModel(
+        "project.task",
+        "mirror_project_task",
+        {
+            "name": "varchar",
+            "active": "boolean",
+            "project_id": "integer",
+            "parent_id": "integer",
+            "stage_id": "integer",
+            "state": "varchar",
+            "priority": "varchar",
+            "sequence": "integer",
+            "progress": "double precision",
+            "effective_hours": "double precision",
+            "allocated_hours": "double precision",
+            "date_deadline": "timestamp",
+            "user_ids": "integer[]",
+            "tag_ids": "integer[]",
+        },
+        WITH_ARCHIVED,
+    ),
+    MirrorModel(
+        "res.users",
+        "mirror_res_users",
+        {"name": "varchar", "login": "varchar", "active": "boolean"},
+        WITH_ARCHIVED,
+    ),
+    MirrorModel("project.tags", "mirror_project_tags", {"name": "varchar", "color": "integer"}),
+]
+
+
+def to_column(value, pg_type: str):
+    """Convert an Odoo RPC value to what asyncpg's COPY expects for `pg_type`"""
+    if pg_type == "boolean":
+        return bool(value)
+    if pg_type.endswith("[]"):
+        return list(value or [])
+    if value is False or value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        # many2one: [id, display_name]
+        value = value[0]
+    if pg_type == "timestamp":
+        return datetime.strptime(value, ODOO_DATETIME_FORMAT)
+    if pg_type == "date":
+        return date.fromisoformat(value)
+    if pg_type == "double precision":
+        return float(value)
+    if pg_type == "jsonb":
+        return json.dumps(value)
+    return value
+
+
+class MirrorSync:
+    """Keeps local tables in step with Odoo models
+
+    Each run pulls only the records whose `write_date` is at or past the
+    model's watermark, streamed by id (keyset pagination), COPYs every page
+    into a temporary staging table and upserts it into the mirror in one
+    statement. Odoo reports `write_date` to the second and stamps it when the
+    writing transaction starts, so the saved watermark trails the newest value
+    seen by `overlap` seconds; the few records pulled twice are plain upserts.
+    Deletions never show up in a delta, so every `reconcile_interval` seconds
+    the full id list is fetched and local rows missing from it are dropped.
+    """
+
+    def __init__(
+        self,
+        client,
+        pool,
+        models: List[MirrorModel] = None,
+        overlap: float = None,
+        reconcile_interval: float = None,
+        chunk_size: int = None,
+    ):
+        self.client = client
+        self.pool = pool
+        self.models = models or DEFAULT_MODELS
+        self.overlap = timedelta(
+            seconds=settings.MIRROR_OVERLAP if overlap is None else overlap
+        )
+        self.reconcile_interval = timedelta(
+            seconds=settings.MIRROR_RECONCILE_INTERVAL
+            if reconcile_interval is None
+            else reconcile_interval
+        )
+        self.chunk_size = chunk_size or settings.ODOO_CHUNK_SIZE
+        self.upserted = 0
+        self.deleted = 0
+
+    async def setup(self):
+        """Create the watermark table and any missing mirror tables"""
+        async with self.pool.acquire() as conn:
+            await conn.execute(WATERMARK_TABLE)
+            for spec in self.models:
+                columns = ", ".join(
+                    f"{name} {pg_type}" for name, pg_type in spec.column_types().items()
+                )
+                await conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {spec.table} ({columns}, PRIMARY KEY (id))"
+                )
+                await conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {spec.table}_write_date_idx "
+                    f"ON {spec.table} (write_date)"
+                )
+
+    async def sync_all(self) -> Dict[str, dict]:
+        """One delta run over every mirrored model, reconciling those that are due"""
+        results = {}
+        for spec in self.models:
+            try:
+                results[spec.model] = await self.sync_model(spec)
+            except Exception as e:
+                # One failing model must not hold back the others
+                logger.error("Mirror sync failed", model=spec.model, error=str(e))
+                results[spec.model] = {"error": str(e)}
+        return results
+
+    async def sync_model(self, spec: MirrorModel) -> dict:
+        started = time.monotonic()
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(WATERMARK_QUERY, spec.model)
+
+        domain = list(spec.domain)
+        if row is not None:
+            domain.append(("write_date", ">=", row["write_date"].strftime(ODOO_DATETIME_FORMAT)))
+
+        upserted = 0
+        newest: Optional[datetime] = None
+        async for chunk in self.client.iter_record_chunks(
+            spec.model, domain, spec.fields, chunk_size=self.chunk_size, prefetch=True
+        ):
+            records = self._to_records(spec, chunk)
+            await self._upsert(spec, records)
+            upserted += len(records)
+            write_dates = [record[1] for record in records if record[1]]
+            if write_dates:
+                newest = max(write_dates + ([newest] if newest else []))
+
+        if newest is not None:
+            async with self.pool.acquire() as conn:
+                await conn.execute(SAVE_WATERMARK, spec.model, newest - self.overlap)
+
+        # A first run is a full load, which counts as reconciled
+        deleted = None
+        if row is not None and (
+            row["reconciled_at"] is None
+            or datetime.utcnow() - row["reconciled_at"] >= self.reconcile_interval
+        ):
+            deleted = await self.reconcile(spec)
+
+        self.upserted += upserted
+        result = {
+            "upserted": upserted,
+            "deleted": deleted,
+            "seconds": round(time.monotonic() - started, 3),
+        }
+        logger.info("Mirror sync finished", model=spec.model, **result)
+        return result
+
+    def _to_records(self, spec: MirrorModel, chunk: List[Dict]) -> List[tuple]:
+        types = spec.column_types()
+        return [
+            tuple(to_column(record.get(name, False), types[name]) for name in spec.fields)
+            for record in chunk
+        ]
+
+    async def _upsert(self, spec: MirrorModel, records: List[tuple]):
+        columns = spec.fields
+        stage = f"{spec.table}_stage"
+        updates = ", ".join(f"{name} = EXCLUDED.{name}" for name in columns if name != "id")
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMP TABLE {stage} (LIKE {spec.table}) ON COMMIT DROP"
+                )
+                await conn.copy_records_to_table(stage, records=records, columns=columns)
+                await conn.execute(
+                    f"INSERT INTO {spec.table} ({', '.join(columns)}) "
+                    f"SELECT {', '.join(columns)} FROM {stage} "
+                    f"ON CONFLICT (id) DO UPDATE SET {updates}"
+                )
+
+    async def reconcile(self, spec: MirrorModel) -> int:
+        """Delete mirrored rows whose record no longer exists in Odoo"""
+        ids = []
+        async for chunk in self.client.iter_record_chunks(
+            spec.model, list(spec.domain), ["id"], chunk_size=self.chunk_size * 10
+        ):
+            ids.extend((record["id"],) for record in chunk)
+
+        stage = f"{spec.table}_ids"
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMP TABLE {stage} (id integer PRIMARY KEY) ON COMMIT DROP"
+                )
+                await conn.copy_records_to_table(stage, records=ids, columns=["id"])
+                status = await conn.execute(
+                    f"DELETE FROM {spec.table} t "
+                    f"WHERE NOT EXISTS (SELECT 1 FROM {stage} s WHERE s.id = t.id)"
+                )
+                await conn.execute(SAVE_RECONCILED, spec.model)
+
+        deleted = int(status.split()[-1])
+        self.deleted += deleted
+        return deleted
+
+    def stats(self) -> dict:
+        return {"upserted": self.upserted, "deleted": self.deleted}
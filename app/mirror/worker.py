@@ -0,0 +1,104 @@
+"""Mirror worker: periodically delta-syncs Odoo models into local PostgreSQL"""
+
+import asyncio
+import signal
+import sys
+
+import structlog
+from fastapi import FastAPI
+
+from app.config import settings
+from app.core.asyncpg_connect import ConfigureAsyncpg
+from app.mirror.sync import MirrorSync
+from app.odoo.client import odoo_pool
+
+logger = structlog.get_logger()
+
+
+class MirrorWorker:
+    """Worker running a mirror sync every MIRROR_INTERVAL seconds"""
+
+    def __init__(self):
+        if not settings.MIRROR_DATABASE_URI or (
+            settings.MIRROR_DATABASE_URI == settings.asyncpg_dsn
+        ):
+            # The main DSN is Odoo's own database: never create mirror tables there
+            raise RuntimeError(
+                "MIRROR_DATABASE_URI must be set to a database other than Odoo's"
+            )
+        self.db = ConfigureAsyncpg(
+            FastAPI(),
+            settings.MIRROR_DATABASE_URI,
+            db_code="mirror",
+            **settings.POSTGRES_CONN_OPTION
+        )
+        self.sync = None
+        self.running = False
+
+    async def start(self):
+        """Start the mirror worker"""
+        try:
+            await self.db.on_connect()
+            client = await odoo_pool.get_client(
+                settings.ODOO_URL,
+                settings.ODOO_DATABASE,
+                settings.ODOO_USERNAME,
+                settings.ODOO_PASSWORD,
+            )
+            self.sync = MirrorSync(client, self.db.pool)
+            await self.sync.setup()
+            self.running = True
+
+            # Register signal handlers
+            signal.signal(signal.SIGINT, self.signal_handler)
+            signal.signal(signal.SIGTERM, self.signal_handler)
+
+            logger.info(
+                "Starting mirror worker",
+                models=[spec.model for spec in self.sync.models],
+                interval=settings.MIRROR_INTERVAL,
+            )
+
+            while self.running:
+                await self.sync.sync_all()
+                await asyncio.sleep(settings.MIRROR_INTERVAL)
+
+        except Exception as e:
+            logger.error("Failed to start mirror worker", error=str(e))
+            raise
+
+    def signal_handler(self, signum, frame):
+        """Handle shutdown signals"""
+        logger.info("Received shutdown signal", signal=signum)
+        self.running = False
+        sys.exit(0)
+
+    async def stop(self):
+        """Stop the mirror worker"""
+        self.running = False
+        if self.sync is not None:
+            await self.db.on_disconnect()
+        logger.info("Mirror worker stopped", **(self.sync.stats() if self.sync else {}))
+
+
+async def main():
+    """Main entry point for mirror worker"""
+    try:
+        worker = MirrorWorker()
+    except RuntimeError as e:
+        logger.error("Mirror worker not configured", error=str(e))
+        sys.exit(1)
+
+    try:
+        await worker.start()
+    except KeyboardInterrupt:
+        logger.info("Mirror worker interrupted by user")
+    except Exception as e:
+        logger.error("Mirror worker failed", error=str(e))
+        sys.exit(1)
+    finally:
+        await worker.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
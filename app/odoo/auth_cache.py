@@ -0,0 +1,63 @@
+"""Redis cache of authenticated Odoo logins, shared by all workers"""
+
+import hashlib
+import hmac
+from typing import Optional
+
+from app.cache.redis_client import redis_client
+from app.config import settings
+
+
+class AuthCache:
+    """Map (url, db, login, credential HMAC) to the uid Odoo authenticated
+
+    Only successful logins are stored, under an HMAC of the credentials keyed
+    with the API secret, so Redis never holds anything a password could be
+    recovered from. A changed password yields a different key; entries for the
+    old one are dropped when Odoo rejects them, and expire after the TTL.
+    """
+
+    prefix = "odoo:auth"
+
+    def __init__(self, redis=None):
+        self.redis = redis or redis_client
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, url: str, db: str, username: str, password: str) -> str:
+        digest = hmac.new(
+            settings.API_KEY.encode("utf-8"),
+            "\0".join(map(str, (url, db, username, password))).encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        return "%s:%s" % (self.prefix, digest)
+
+    async def get(self, url: str, db: str, username: str, password: str) -> Optional[int]:
+        """Cached uid for these credentials, or None"""
+        if not settings.ODOO_AUTH_CACHE_TTL:
+            return None
+        uid = await self.redis.get(self._key(url, db, username, password))
+        if uid:
+            self.hits += 1
+            return int(uid)
+        self.misses += 1
+        return None
+
+    async def set(self, url: str, db: str, username: str, password: str, uid: int):
+        if settings.ODOO_AUTH_CACHE_TTL:
+            await self.redis.set(
+                self._key(url, db, username, password),
+                uid,
+                expire=settings.ODOO_AUTH_CACHE_TTL,
+            )
+
+    async def invalidate(self, url: str, db: str, username: str, password: str):
+        """Forget credentials Odoo no longer accepts"""
+        await self.redis.delete(self._key(url, db, username, password))
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+# Global Odoo login cache
+auth_cache = AuthCache()
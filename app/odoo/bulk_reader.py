@@ -0,0 +1,88 @@
+"""Parallel, id-range sharded bulk reads from Odoo"""
+
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from app.config import settings
+
+# More shards than workers, so one dense id range does not leave the other
+# workers idle at the end of a reload
+SHARDS_PER_WORKER = 4
+
+
+class ParallelBulkReader:
+    """Read a whole model with `workers` concurrent keyset cursors
+
+    The id space between the lowest and highest matching id is split into
+    contiguous ranges; each range is streamed with `iter_record_chunks`, and
+    the ranges are merged back in id order.
+    """
+
+    def __init__(self, client, workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        self.client = client
+        self.workers = workers or settings.ODOO_BULK_READ_WORKERS
+        self.chunk_size = chunk_size or settings.ODOO_CHUNK_SIZE
+
+    async def id_bounds(self, model: str, domain: List) -> Optional[Tuple[int, int]]:
+        """Lowest and highest id matching `domain`, or None if nothing matches"""
+        lowest, highest = await asyncio.gather(
+            self.client.execute_kw(model, "search", [domain], {"order": "id asc", "limit": 1}),
+            self.client.execute_kw(model, "search", [domain], {"order": "id desc", "limit": 1}),
+        )
+        if not lowest:
+            return None
+        return lowest[0], highest[0]
+
+    def shards(self, lowest: int, highest: int) -> List[Tuple[int, int]]:
+        """Split [lowest, highest] into contiguous inclusive id ranges"""
+        count = min(self.workers * SHARDS_PER_WORKER, highest - lowest + 1)
+        step, extra = divmod(highest - lowest + 1, count)
+        ranges, start = [], lowest
+        for index in range(count):
+            end = start + step + (1 if index < extra else 0) - 1
+            ranges.append((start, end))
+            start = end + 1
+        return ranges
+
+    async def _read_shard(
+        self, semaphore: asyncio.Semaphore, model: str, domain: List, fields: List, shard: Tuple[int, int]
+    ) -> List[Dict]:
+        start, end = shard
+        shard_domain = list(domain) + [("id", ">=", start), ("id", "<=", end)]
+        records = []
+        async with semaphore:
+            async for chunk in self.client.iter_record_chunks(
+                model, shard_domain, fields, self.chunk_size
+            ):
+                records.extend(chunk)
+        return records
+
+    async def iter_chunks(
+        self, model: str, domain: List = None, fields: List = None
+    ) -> AsyncIterator[List[Dict]]:
+        """Yield each shard's records in id order as soon as it is complete"""
+        domain = list(domain or [])
+        bounds = await self.id_bounds(model, domain)
+        if bounds is None:
+            return
+
+        semaphore = asyncio.Semaphore(self.workers)
+        tasks = [
+            asyncio.ensure_future(self._read_shard(semaphore, model, domain, fields, shard))
+            for shard in self.shards(*bounds)
+        ]
+        try:
+            for task in tasks:
+                records = await task
+                if records:
+                    yield records
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def read(self, model: str, domain: List = None, fields: List = None) -> List[Dict]:
+        """Read every matching record, ordered by id"""
+        records = []
+        async for chunk in self.iter_chunks(model, domain, fields):
+            records.extend(chunk)
+        return records
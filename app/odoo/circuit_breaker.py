@@ -0,0 +1,85 @@
+"""Circuit breaker for Odoo endpoints"""
+
+import time
+from typing import Dict, Optional
+
+from app.config import settings
+from app.odoo.exceptions import OdooCircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for one Odoo endpoint
+
+    After `failure_threshold` consecutive outage errors the breaker opens and
+    calls fail fast with `OdooCircuitOpenError`. Once `reset_timeout` seconds
+    have passed, a single probe call is let through (half-open): success
+    closes the breaker, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+    ):
+        self.failure_threshold = failure_threshold or settings.ODOO_BREAKER_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout or settings.ODOO_BREAKER_RESET_TIMEOUT
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._probing = False
+
+    def before_call(self):
+        """Raise `OdooCircuitOpenError` unless the call may go through"""
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                raise OdooCircuitOpenError("Odoo is unavailable (circuit open)")
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            if self._probing:
+                self.rejected += 1
+                raise OdooCircuitOpenError("Odoo is unavailable (circuit half-open)")
+            self._probing = True
+
+    def record_success(self):
+        self._probing = False
+        self.state = CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        self._probing = False
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def record_abandoned(self):
+        """The call was cancelled before Odoo answered: allow another probe"""
+        self._probing = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(endpoint: str) -> CircuitBreaker:
+    """Process-wide circuit breaker for one Odoo endpoint"""
+    breaker = _breakers.get(endpoint)
+    if breaker is None:
+        breaker = _breakers[endpoint] = CircuitBreaker()
+    return breaker
+
+
+def breaker_stats() -> Dict[str, dict]:
+    return {endpoint: breaker.stats() for endpoint, breaker in _breakers.items()}
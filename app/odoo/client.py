@@ -1,23 +1,40 @@
 """Odoo XML-RPC client for FastAPI integration"""
 
+import asyncio
+import hashlib
+import json
 import logging
-import xmlrpc.client
-from typing import Any, Dict, List, Optional
-
-# import aiohttp
-# import asyncio
-from urllib.parse import urljoin
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from app.config import settings
+from app.odoo.auth_cache import auth_cache
+from app.odoo.bulk_reader import ParallelBulkReader
+from app.odoo.exceptions import (
+    OdooBulkCreateError,
+    OdooOrderConfirmError,
+    OdooUnavailableError,
+)
+from app.odoo.record_store import record_store
+from app.odoo.singleflight import READ_METHODS, flight_key, odoo_singleflight
+from app.odoo.transport import is_access_denied, make_transport
+from app.odoo.write_batcher import write_batcher
 
 _logger = logging.getLogger(__name__)
 
 
 class OdooClient:
-    """Async Odoo XML-RPC client"""
+    """Async Odoo RPC client (XML-RPC or JSON-RPC, see `ODOO_TRANSPORT`)"""
 
     def __init__(
-        self, url: str, db: str, username: str, password: str, uid: Optional[int] = None
+        self,
+        url: str,
+        db: str,
+        username: str,
+        password: str,
+        uid: Optional[int] = None,
+        transport: Optional[str] = None,
     ):
         self.url = url
         self.db = db
@@ -25,20 +42,32 @@ class OdooClient:
         self.password = password
         self.uid = uid
 
-        # Create XML-RPC clients
-        self.common = xmlrpc.client.ServerProxy(urljoin(url, "/xmlrpc/2/common"))
-        self.models = xmlrpc.client.ServerProxy(urljoin(url, "/xmlrpc/2/object"))
+        # Non-blocking transport, shared by `common` and `object` calls
+        self.transport = make_transport(url, transport)
 
     async def authenticate(self) -> Optional[int]:
-        """Authenticate with Odoo and return user ID"""
+        """Authenticate with Odoo and return user ID
+
+        A login another worker (or an earlier request) already authenticated is
+        taken from the shared auth cache without calling Odoo.
+        """
+        credentials = (self.url, self.db, self.username, self.password)
+        uid = await auth_cache.get(*credentials)
+        if uid:
+            self.uid = uid
+            return uid
         try:
-            self.uid = self.common.authenticate(
-                self.db, self.username, self.password, {}
+            self.uid = await self.transport.call(
+                "common", "authenticate", self.db, self.username, self.password, {}
             )
             if not self.uid:
+                await auth_cache.invalidate(*credentials)
                 raise Exception("Invalid credentials or database name")
 
+            await auth_cache.set(*credentials, self.uid)
             return self.uid
+        except OdooUnavailableError:
+            raise
         except Exception as e:
             raise Exception(f"Odoo authentication failed: {str(e)}")
 
@@ -52,12 +81,54 @@ class OdooClient:
         if kwargs is None:
             kwargs = {}
 
+        if method in READ_METHODS:
+            # Identical concurrent reads share one RPC
+            key = flight_key(self._scope(), model, method, args, kwargs)
+            return await odoo_singleflight.do(
+                key, lambda: self._call_kw(model, method, args, kwargs)
+            )
+        if (
+            method == "write"
+            and not kwargs
+            and len(args) == 2
+            and write_batcher.window
+            and (isinstance(args[0], int) or len(args[0]) == 1)
+        ):
+            # Single-record writes within a short window are merged into as few
+            # RPCs as possible; multi-record writes go out as they are
+            record_id = args[0] if isinstance(args[0], int) else args[0][0]
+            result = await write_batcher.write(self, model, record_id, args[1])
+        else:
+            result = await self._call_kw(model, method, args, kwargs)
+        # Keep the record store in line with writes made through this API
+        if method in ("write", "unlink") and args:
+            await record_store.invalidate(model, args[0])
+        elif method == "create":
+            await record_store.invalidate_missing(model)
+        return result
+
+    def _scope(self) -> tuple:
+        """Credential scope: reads are only shared between identical logins"""
+        secret = hashlib.sha256(self.password.encode("utf-8")).hexdigest()
+        return (self.url, self.db, self.uid, self.username, secret)
+
+    async def _call_kw(self, model: str, method: str, args: List, kwargs: Dict) -> Any:
         try:
-            return self.models.execute_kw(
-                self.db, self.uid, self.password, model, method, args, kwargs
+            return await self.transport.call(
+                "object",
+                "execute_kw",
+                self.db,
+                self.uid,
+                self.password,
+                model,
+                method,
+                args,
+                kwargs,
             )
+        except OdooUnavailableError:
+            raise
         except Exception as e:
-            raise Exception(f"Odoo operation failed: {str(e)}")
+            raise Exception(f"Odoo operation failed: {str(e)}") from e
 
     # Inventory Operations
     async def get_stock_quantities(self, product_ids: List[int] = None) -> List[Dict]:
@@ -81,6 +152,10 @@ class OdooClient:
         """Create inventory adjustment line"""
         return await self.execute_kw("stock.inventory.line", "create", [line_data])
 
+    async def create_inventory_lines(self, lines_data: List[Dict]) -> List[int]:
+        """Create inventory adjustment lines in bulk"""
+        return await self.create_records("stock.inventory.line", lines_data)
+
     # Purchase Operations
     async def create_purchase_order(self, order_data: Dict) -> int:
         """Create a new purchase order"""
@@ -90,6 +165,18 @@ class OdooClient:
         """Create purchase order line"""
         return await self.execute_kw("purchase.order.line", "create", [line_data])
 
+    async def create_purchase_order_lines(self, lines_data: List[Dict]) -> List[int]:
+        """Create purchase order lines in bulk"""
+        return await self.create_records("purchase.order.line", lines_data)
+
+    async def create_purchase_order_with_lines(
+        self, order_data: Dict, lines: List[Dict] = None, confirm: bool = False
+    ) -> int:
+        """Create a purchase order and all its lines in one call, optionally confirmed"""
+        return await self._create_order(
+            "purchase.order", order_data, lines, "button_confirm" if confirm else None
+        )
+
     async def confirm_purchase_order(self, order_id: int) -> bool:
         """Confirm purchase order"""
         return await self.execute_kw("purchase.order", "button_confirm", [[order_id]])
@@ -103,10 +190,54 @@ class OdooClient:
         """Create sale order line"""
         return await self.execute_kw("sale.order.line", "create", [line_data])
 
+    async def create_sale_order_lines(self, lines_data: List[Dict]) -> List[int]:
+        """Create sale order lines in bulk"""
+        return await self.create_records("sale.order.line", lines_data)
+
+    async def create_sale_order_with_lines(
+        self, order_data: Dict, lines: List[Dict] = None, confirm: bool = False
+    ) -> int:
+        """Create a sale order and all its lines in one call, optionally confirmed"""
+        return await self._create_order(
+            "sale.order", order_data, lines, "action_confirm" if confirm else None
+        )
+
     async def confirm_sale_order(self, order_id: int) -> bool:
         """Confirm sale order"""
         return await self.execute_kw("sale.order", "action_confirm", [[order_id]])
 
+    @staticmethod
+    def _line_commands(lines: List) -> List:
+        """One2many `(0, 0, vals)` create commands; existing commands pass through"""
+        return [
+            line if isinstance(line, (list, tuple)) else (0, 0, dict(line))
+            for line in lines
+        ]
+
+    async def _create_order(
+        self,
+        model: str,
+        order_data: Dict,
+        lines: Optional[List[Dict]],
+        confirm_method: Optional[str],
+    ) -> int:
+        """Create an order with its `order_line` in one RPC, then confirm it
+
+        Raises `OdooOrderConfirmError`, carrying the new order's id, when the
+        order was created but confirming it failed.
+        """
+        values = dict(order_data)
+        values["order_line"] = self._line_commands(
+            list(values.get("order_line") or []) + list(lines or [])
+        )
+        order_id = await self.execute_kw(model, "create", [values])
+        if confirm_method:
+            try:
+                await self.execute_kw(model, confirm_method, [[order_id]])
+            except Exception as err:
+                raise OdooOrderConfirmError(order_id, err) from err
+        return order_id
+
     # Delivery Operations
     async def create_delivery(self, delivery_data: Dict) -> int:
         """Create delivery order"""
@@ -131,6 +262,10 @@ class OdooClient:
         """Create journal entry line"""
         return await self.execute_kw("account.move.line", "create", [line_data])
 
+    async def create_account_move_lines(self, lines_data: List[Dict]) -> List[int]:
+        """Create journal entry lines in bulk"""
+        return await self.create_records("account.move.line", lines_data)
+
     async def post_account_move(self, move_id: int) -> bool:
         """Post accounting journal entry"""
         return await self.execute_kw("account.move", "action_post", [[move_id]])
@@ -158,6 +293,77 @@ class OdooClient:
 
         return await self.execute_kw(model, "search_read", [domain], kwargs)
 
+    async def iter_record_chunks(
+        self,
+        model: str,
+        domain: List = None,
+        fields: List = None,
+        chunk_size: int = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[List[Dict]]:
+        """Stream a model in chunks, paging by `id > last_id` (keyset pagination)
+
+        Memory stays bounded by `chunk_size` however big the table is. With
+        `prefetch`, the next page is requested while the caller processes the
+        current one.
+        """
+        domain = list(domain or [])
+        fields = list(fields or ["id", "name"])
+        if "id" not in fields:
+            fields.append("id")
+        chunk_size = chunk_size or settings.ODOO_CHUNK_SIZE
+
+        def fetch(last_id: int):
+            return self.execute_kw(
+                model,
+                "search_read",
+                [domain + [("id", ">", last_id)]],
+                {"fields": fields, "order": "id asc", "limit": chunk_size},
+            )
+
+        next_chunk = None
+        try:
+            chunk = await fetch(0)
+            while chunk:
+                last_id = chunk[-1]["id"]
+                more = len(chunk) == chunk_size
+                if more and prefetch:
+                    next_chunk = asyncio.ensure_future(fetch(last_id))
+                yield chunk
+                if not more:
+                    return
+                chunk = await (next_chunk if prefetch else fetch(last_id))
+                next_chunk = None
+        finally:
+            # The caller stopped early: drop the page fetched ahead
+            if next_chunk is not None and not next_chunk.done():
+                next_chunk.cancel()
+
+    async def iter_records(
+        self,
+        model: str,
+        domain: List = None,
+        fields: List = None,
+        chunk_size: int = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict]:
+        """Stream a model record by record, see `iter_record_chunks`"""
+        async for chunk in self.iter_record_chunks(
+            model, domain, fields, chunk_size, prefetch
+        ):
+            for record in chunk:
+                yield record
+
+    async def bulk_read(
+        self,
+        model: str,
+        domain: List = None,
+        fields: List = None,
+        workers: int = None,
+    ) -> List[Dict]:
+        """Full reload of a model with parallel id-range shards, ordered by id"""
+        return await ParallelBulkReader(self, workers).read(model, domain, fields)
+
     async def read_records(
         self, model: str, record_ids: List[int], fields: List = None
     ) -> List[Dict]:
@@ -172,10 +378,78 @@ class OdooClient:
             print(type(value))
         return await self.execute_kw(model, "create", [values])
 
+    async def create_records(self, model: str, vals_list: List[Dict]) -> List[int]:
+        """Create many records with as few `create` calls as the payload allows
+
+        Rows are sent in chunks of at most `ODOO_CREATE_CHUNK_BYTES` serialized
+        bytes and `ODOO_CHUNK_SIZE` rows; ids come back in the order of
+        `vals_list`. A chunk Odoo rejects is split in halves until the bad rows
+        are isolated, and the remaining rows are still created. If any row
+        fails, `OdooBulkCreateError` reports the ids created and the failures.
+        """
+        ids: List[Optional[int]] = []
+        errors: Dict[int, str] = {}
+        for start, chunk in self._create_chunks(vals_list):
+            try:
+                await self._create_chunk(model, chunk, start, ids, errors)
+            except OdooUnavailableError as err:
+                # Nothing more can be created; report the rest as not created
+                errors.update(dict.fromkeys(range(len(ids), len(vals_list)), str(err)))
+                ids.extend([None] * (len(vals_list) - len(ids)))
+                break
+        if errors:
+            raise OdooBulkCreateError(ids, errors)
+        return ids
+
+    @staticmethod
+    def _create_chunks(vals_list: List[Dict]):
+        max_bytes = settings.ODOO_CREATE_CHUNK_BYTES
+        max_rows = settings.ODOO_CHUNK_SIZE
+        chunk, size, start = [], 0, 0
+        for index, vals in enumerate(vals_list):
+            row_size = len(json.dumps(vals, default=str))
+            if chunk and (size + row_size > max_bytes or len(chunk) >= max_rows):
+                yield start, chunk
+                chunk, size, start = [], 0, index
+            chunk.append(vals)
+            size += row_size
+        if chunk:
+            yield start, chunk
+
+    async def _create_chunk(
+        self,
+        model: str,
+        chunk: List[Dict],
+        start: int,
+        ids: List[Optional[int]],
+        errors: Dict[int, str],
+    ):
+        try:
+            created = await self.execute_kw(model, "create", [chunk])
+        except OdooUnavailableError:
+            raise
+        except Exception as err:
+            # A failed create rolls back the whole call: bisect to find bad rows
+            if len(chunk) == 1:
+                errors[start] = str(err)
+                ids.append(None)
+                return
+            middle = len(chunk) // 2
+            await self._create_chunk(model, chunk[:middle], start, ids, errors)
+            await self._create_chunk(model, chunk[middle:], start + middle, ids, errors)
+            return
+        ids.extend(created if isinstance(created, list) else [created])
+
     async def update_record(self, model: str, record_id: int, values: Dict) -> bool:
         """Update existing record in any model"""
         return await self.execute_kw(model, "write", [[record_id], values])
 
+    async def update_records(
+        self, model: str, record_ids: List[int], values: Dict
+    ) -> bool:
+        """Write the same values to several records with one call"""
+        return await self.execute_kw(model, "write", [list(record_ids), values])
+
     async def read_record(
         self, model: str, record_id: int, fields: List = None
     ) -> Dict:
@@ -192,44 +466,120 @@ class OdooClient:
         """Delete record"""
         return await self.execute_kw(model, "unlink", [[record_id]])
 
+    async def close(self):
+        """Release the transport's HTTP resources"""
+        await self.transport.close()
+
 
 class OdooClientPool:
-    """Pool of Odoo clients for concurrent operations"""
+    """Bounded pool of Odoo clients for concurrent operations
 
-    def __init__(self):
-        self.clients = {}
+    Clients are kept in LRU order and dropped after `ttl` seconds without use
+    or when the pool grows past `max_size`. A uid index gives O(1) lookups
+    by Odoo user ID.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[str] = None,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.clients: "OrderedDict[str, OdooClient]" = OrderedDict()
+        self.transport = transport
+        self.max_size = max_size or settings.ODOO_CLIENT_POOL_SIZE
+        self.ttl = ttl or settings.ODOO_CLIENT_POOL_TTL
+        self.evictions = 0
+        self._last_used: Dict[str, float] = {}
+        self._by_uid: Dict[int, str] = {}
 
     async def get_client(
         self, url: str, db: str, username: str, password: str, uid: Optional[int] = None
     ) -> OdooClient:
         """Get or create Odoo client from pool"""
         key = f"{db}:{username}"
-
-        if key not in self.clients:
-            client = OdooClient(url or settings.ODOO_URL, db, username, password, uid)
+        url = url or settings.ODOO_URL
+        self._expire()
+
+        client = self.clients.get(key)
+        if client is not None and (client.password != password or client.url != url):
+            # Credentials changed: never reuse the old login, but only replace
+            # it once the new one authenticates (a wrong password must not
+            # evict a valid client)
+            client = None
+
+        if client is None:
+            client = OdooClient(url, db, username, password, uid, transport=self.transport)
             if not uid:
                 await client.authenticate()
+            if key in self.clients:
+                self._remove(key)
             self.clients[key] = client
+            while len(self.clients) > self.max_size:
+                self._remove(next(iter(self.clients)))
+                self.evictions += 1
+        else:
+            self.clients.move_to_end(key)
 
-        return self.clients[key]
+        self._last_used[key] = time.monotonic()
+        if client.uid:
+            self._by_uid[client.uid] = key
+        return client
 
     async def get_client_by_uid(self, uid: int) -> Optional[OdooClient]:
         """Get Odoo client by user ID from pool"""
-        for client in self.clients.values():
-            if client.uid == uid:
-                return client
-        return None
+        self._expire()
+        key = self._by_uid.get(uid)
+        if key is None:
+            return None
+        self.clients.move_to_end(key)
+        self._last_used[key] = time.monotonic()
+        return self.clients[key]
+
+    def invalidate(self, db: str, username: str):
+        """Drop a login from the pool, e.g. after an authentication failure"""
+        key = f"{db}:{username}"
+        if key in self.clients:
+            self._remove(key)
+
+    def _expire(self):
+        """Drop clients idle for longer than the TTL (oldest first)"""
+        deadline = time.monotonic() - self.ttl
+        while self.clients:
+            key = next(iter(self.clients))
+            if self._last_used[key] > deadline:
+                break
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        client = self.clients.pop(key)
+        self._last_used.pop(key, None)
+        if self._by_uid.get(client.uid) == key:
+            del self._by_uid[client.uid]
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self.clients),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "evictions": self.evictions,
+        }
 
     async def close_all(self):
         """Close all clients in pool"""
+        for client in self.clients.values():
+            await client.close()
         self.clients.clear()
+        self._last_used.clear()
+        self._by_uid.clear()
 
 
 class SessionOdooClient:
     """Session-based Odoo client that uses cookies for authentication"""
 
-    def __init__(self):
-        self.pool = OdooClientPool()
+    def __init__(self, pool: Optional[OdooClientPool] = None):
+        self.pool = pool or odoo_pool
 
     async def authenticate_and_get_uid(
         self, url: str, db: str, username: str, password: str
@@ -257,9 +607,16 @@ class SessionOdooClient:
             try:
                 return await client.execute_kw(model, method, args, kwargs)
             except Exception as err:
+                if not is_access_denied(err):
+                    # Business errors (ValidationError, AccessError, ...) and
+                    # outages: re-authenticating would not help, and would
+                    # repeat a call that may not be idempotent
+                    raise
                 _logger.error("Error : %s", err)
                 # If session is invalid, re-authenticate
                 print("Session invalid, re-authenticating...")
+                self.pool.invalidate(db, username)
+                await auth_cache.invalidate(url or settings.ODOO_URL, db, username, password)
                 client = await self.pool.get_client(url, db, username, password)
                 return await client.execute_kw(model, method, args, kwargs)
         else:
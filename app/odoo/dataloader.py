@@ -0,0 +1,67 @@
+"""Request-scoped DataLoader batching for Odoo related-record lookups"""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional, Union
+
+from app.odoo.metadata import field_metadata
+from app.odoo.record_store import record_store
+
+
+class RecordLoader:
+    """Batch and cache `model` reads by id for the lifetime of one request
+
+    Every id requested during one event-loop tick is fetched with a single
+    record store read, which only asks Odoo for ids not cached in Redis; ids
+    already loaded (or in flight) are served from the per-request cache and
+    never fetched twice.
+    """
+
+    def __init__(self, odoo, model: str, fields: List[str]):
+        self.odoo = odoo
+        self.model = model
+        self.fields = fields
+        self.batches = 0
+        self._cache: Dict[int, asyncio.Future] = {}
+        self._queue: List[int] = []
+
+    def load(self, record_id: int) -> asyncio.Future:
+        """Future resolving to the record dict, or None if it does not exist"""
+        future = self._cache.get(record_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[record_id] = future
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(record_id)
+        return future
+
+    async def load_many(self, record_ids: Union[int, Iterable[int]]) -> List[dict]:
+        """Load several records, skipping ids that do not exist"""
+        if isinstance(record_ids, int):
+            record_ids = [record_ids]
+        records = await asyncio.gather(*(self.load(rid) for rid in record_ids))
+        return [record for record in records if record is not None]
+
+    def _dispatch(self):
+        ids, self._queue = self._queue, []
+        asyncio.ensure_future(self._fetch(ids))
+
+    async def _fetch(self, ids: List[int]):
+        self.batches += 1
+        try:
+            fields = await field_metadata.prune(self.odoo, self.model, self.fields)
+            records = await record_store.read(self.odoo, self.model, ids, fields)
+        except Exception as err:
+            for record_id in ids:
+                # Forget failed ids so a later load can retry them
+                future = self._cache.pop(record_id)
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        by_id: Dict[int, Optional[dict]] = {record["id"]: record for record in records}
+        for record_id in ids:
+            future = self._cache[record_id]
+            if not future.done():
+                future.set_result(by_id.get(record_id))
@@ -0,0 +1,147 @@
+"""Odoo domain canonicalization and query fingerprints"""
+
+import hashlib
+import json
+from typing import Any, List, Optional, Sequence
+
+AND, OR, NOT = "&", "|", "!"
+
+OPERATOR_ALIASES = {"==": "=", "<>": "!="}
+SET_OPERATORS = ("in", "not in")
+
+# Where the domain / fields / order / limit / offset live in execute_kw calls
+SEARCH_METHODS = ("search", "search_read", "search_count")
+
+
+def _sort_key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _digest(value: Any) -> str:
+    return hashlib.blake2b(_sort_key(value).encode("utf-8"), digest_size=12).hexdigest()
+
+
+def _leaf(term: Sequence) -> tuple:
+    field, operator, value = term
+    operator = operator.strip().lower() if isinstance(operator, str) else operator
+    operator = OPERATOR_ALIASES.get(operator, operator)
+    if operator in SET_OPERATORS:
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        value = sorted({_sort_key(v): v for v in values}.values(), key=_sort_key)
+    elif isinstance(value, tuple):
+        value = list(value)
+    return (field, operator, value)
+
+
+def _parse(domain: List, pos: int):
+    if pos >= len(domain):
+        raise ValueError(f"Malformed domain, an operator lacks an operand: {domain!r}")
+    token = domain[pos]
+    if token in (AND, OR):
+        left, pos = _parse(domain, pos + 1)
+        right, pos = _parse(domain, pos)
+        return (token, [left, right]), pos
+    if token == NOT:
+        child, pos = _parse(domain, pos + 1)
+        return (NOT, child), pos
+    if not isinstance(token, (list, tuple)) or len(token) != 3:
+        raise ValueError(f"Malformed domain term {token!r} in {domain!r}")
+    return _leaf(token), pos + 1
+
+
+def _canonical(node):
+    """Flatten nested &/| nodes, drop duplicates and sort operands"""
+    if node[0] == NOT:
+        child = _canonical(node[1])
+        if child[0] == NOT:
+            return child[1]
+        return (NOT, child)
+    if node[0] not in (AND, OR):
+        return node
+
+    operator, children = node[0], []
+    for child in map(_canonical, node[1]):
+        children.extend(child[1] if child[0] == operator else [child])
+    unique = {_sort_key(child): child for child in children}
+    children = [unique[key] for key in sorted(unique)]
+    return children[0] if len(children) == 1 else (operator, children)
+
+
+def _serialize(node) -> List:
+    if node[0] == NOT:
+        return [NOT] + _serialize(node[1])
+    if node[0] in (AND, OR):
+        terms = [node[0]] * (len(node[1]) - 1)
+        for child in node[1]:
+            terms.extend(_serialize(child))
+        return terms
+    return [node]
+
+
+def normalize_domain(domain: Optional[List]) -> List:
+    """Canonical form of an Odoo domain
+
+    Equivalent domains map to the same list: operator aliases are unified,
+    `in` / `not in` values are sorted and deduplicated, nested &/| operators
+    are flattened and their operands sorted. The top-level AND stays implicit.
+    """
+    if not domain:
+        return []
+    nodes, pos = [], 0
+    while pos < len(domain):
+        node, pos = _parse(list(domain), pos)
+        nodes.append(node)
+    root = _canonical((AND, nodes))
+    if root[0] == AND:
+        terms = []
+        for child in root[1]:
+            terms.extend(_serialize(child))
+        return terms
+    return _serialize(root)
+
+
+def query_fingerprint(
+    model: str,
+    method: str,
+    domain: Optional[List] = None,
+    fields: Optional[List[str]] = None,
+    order: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> str:
+    """Compact, deterministic key for an Odoo query"""
+    return _digest(
+        [
+            model,
+            method,
+            normalize_domain(domain),
+            sorted(set(fields or [])),
+            " ".join((order or "").lower().split()),
+            limit or None,
+            offset or 0,
+        ]
+    )
+
+
+def fingerprint_call(model: str, method: str, args: List, kwargs: Optional[dict]) -> str:
+    """Fingerprint an `execute_kw` call, canonicalizing search domains"""
+    kwargs = dict(kwargs or {})
+    if method in SEARCH_METHODS and args:
+        extra = {
+            key: kwargs.pop(key)
+            for key in list(kwargs)
+            if key not in ("fields", "order", "limit", "offset")
+        }
+        base = query_fingerprint(
+            model,
+            method,
+            args[0],
+            kwargs.get("fields"),
+            kwargs.get("order"),
+            kwargs.get("limit"),
+            kwargs.get("offset"),
+        )
+        if not extra and len(args) == 1:
+            return base
+        return _digest([base, args[1:], extra])
+    return _digest([model, method, args, kwargs])
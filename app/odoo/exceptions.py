@@ -0,0 +1,39 @@
+"""Odoo client exceptions"""
+
+
+class OdooUnavailableError(Exception):
+    """Odoo cannot take the call right now; the caller should retry later"""
+
+
+class OdooOverloadedError(OdooUnavailableError):
+    """The call was shed by the adaptive concurrency limiter"""
+
+
+class OdooCircuitOpenError(OdooUnavailableError):
+    """The endpoint's circuit breaker is open; the call was not sent"""
+
+
+class OdooBulkCreateError(Exception):
+    """Some rows of a bulk create failed; the others were created
+
+    `ids` follows the order of the submitted rows, with None for rows that were
+    not created; `errors` maps those rows' indexes to the error message.
+    """
+
+    def __init__(self, ids: list, errors: dict):
+        super().__init__(f"{len(errors)} of {len(ids)} records could not be created")
+        self.ids = ids
+        self.errors = errors
+
+
+class OdooOrderConfirmError(Exception):
+    """An order was created but could not be confirmed
+
+    `order_id` is the created (draft) order: confirm it again rather than
+    creating a new one.
+    """
+
+    def __init__(self, order_id: int, cause: Exception):
+        super().__init__(f"Order {order_id} was created but not confirmed: {cause}")
+        self.order_id = order_id
+        self.cause = cause
@@ -0,0 +1,107 @@
+"""Shared keep-alive HTTP connection pools for Odoo hosts"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from app.config import settings
+
+
+@dataclass
+class PoolStats:
+    """Saturation counters for one Odoo host"""
+
+    size: int
+    in_flight: int = 0
+    waiting: int = 0
+    peak_in_flight: int = 0
+    peak_waiting: int = 0
+    requests: int = 0
+    waited_requests: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+class OdooHttpPool:
+    """Bounded keep-alive connection pool per Odoo host
+
+    Every Odoo transport posts through here, so all clients talking to the same
+    host reuse the same TCP/TLS connections instead of handshaking per call.
+    A semaphore sized like the connector tracks how saturated the pool is.
+    """
+
+    def __init__(self, size: Optional[int] = None, idle_timeout: Optional[float] = None):
+        self.size = size or settings.ODOO_POOL_SIZE
+        self.idle_timeout = idle_timeout or settings.ODOO_POOL_IDLE_TIMEOUT
+        self._hosts: Dict[str, Tuple[aiohttp.ClientSession, asyncio.Semaphore]] = {}
+        self._stats: Dict[str, PoolStats] = {}
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _get_host(self, key: str) -> Tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+        """Return the host's session, recreating it if closed or bound to another loop"""
+        loop = asyncio.get_running_loop()
+        entry = self._hosts.get(key)
+        if entry is None or entry[0].closed or entry[0].loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.size,
+                limit_per_host=self.size,
+                keepalive_timeout=self.idle_timeout,
+            )
+            entry = (aiohttp.ClientSession(connector=connector), asyncio.Semaphore(self.size))
+            self._hosts[key] = entry
+            self._stats.setdefault(key, PoolStats(size=self.size))
+        return entry
+
+    @asynccontextmanager
+    async def post(self, url: str, data: bytes, headers: dict, timeout: aiohttp.ClientTimeout):
+        """POST `data` to `url` over the host's pooled connections"""
+        key = self._host_key(url)
+        session, slots = self._get_host(key)
+        stats = self._stats[key]
+
+        stats.requests += 1
+        stats.waiting += 1
+        stats.peak_waiting = max(stats.peak_waiting, stats.waiting)
+        started = time.perf_counter()
+        try:
+            await slots.acquire()
+        finally:
+            stats.waiting -= 1
+        waited = time.perf_counter() - started
+        if waited > 0.001:
+            stats.waited_requests += 1
+        stats.wait_seconds_total += waited
+        stats.wait_seconds_max = max(stats.wait_seconds_max, waited)
+
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        try:
+            async with session.post(url, data=data, headers=headers, timeout=timeout) as response:
+                yield response
+        finally:
+            stats.in_flight -= 1
+            slots.release()
+
+    def stats(self) -> Dict[str, dict]:
+        """Per-host saturation stats, for sizing the pool under load"""
+        return {host: asdict(stats) for host, stats in self._stats.items()}
+
+    async def close(self):
+        """Close every host session"""
+        for session, _ in self._hosts.values():
+            if not session.closed:
+                await session.close()
+        self._hosts.clear()
+
+
+# Global Odoo HTTP connection pool
+odoo_http_pool = OdooHttpPool()
@@ -0,0 +1,161 @@
+"""Adaptive concurrency limiting for calls to Odoo"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional
+
+import aiohttp
+
+from app.config import settings
+from app.odoo.exceptions import OdooOverloadedError
+
+# Errors that mean Odoo (or the path to it) is struggling, as opposed to
+# business errors such as access rights or validation faults
+OVERLOAD_ERRORS = (asyncio.TimeoutError, aiohttp.ClientError)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit for one Odoo endpoint
+
+    The limit grows by roughly one slot per round of fast calls and is cut
+    multiplicatively when a call fails with a transport error or is slow. A
+    call is slow when it takes longer than both `latency_target` and
+    `tolerance` times the endpoint's baseline, a slow moving average of its
+    call latencies, so an endpoint whose calls are steadily long (bulk reads,
+    reports) is judged against its own normal instead of being throttled to
+    the floor for work it completes fine. Calls above the limit wait in a
+    bounded queue and are rejected with `OdooOverloadedError` when the queue
+    is full or the wait exceeds `queue_timeout`.
+    """
+
+    def __init__(
+        self,
+        initial: Optional[int] = None,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        latency_target: Optional[float] = None,
+        queue_size: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        backoff: float = 0.7,
+        tolerance: float = 2.0,
+        smoothing: float = 0.05,
+    ):
+        self.limit = float(initial or settings.ODOO_LIMIT_INITIAL)
+        self.min_limit = min_limit or settings.ODOO_LIMIT_MIN
+        self.max_limit = max_limit or settings.ODOO_LIMIT_MAX
+        self.latency_target = latency_target or settings.ODOO_LIMIT_LATENCY_TARGET
+        self.queue_size = queue_size or settings.ODOO_LIMIT_QUEUE_SIZE
+        self.queue_timeout = queue_timeout or settings.ODOO_LIMIT_QUEUE_TIMEOUT
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.baseline: Optional[float] = None
+
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._last_decrease = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self):
+        """Take a slot, queueing if the current limit is reached"""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            raise OdooOverloadedError("Odoo call queue is full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            self._abandon(waiter)
+            raise OdooOverloadedError(
+                f"Timed out after {self.queue_timeout}s waiting for an Odoo slot"
+            )
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+    def _abandon(self, waiter: asyncio.Future):
+        if waiter.done():
+            # The slot was handed over just as we gave up: pass it on
+            self.in_flight -= 1
+            self._wake()
+        else:
+            waiter.cancel()
+            self._waiters.remove(waiter)
+
+    def release(self, latency: float, overloaded: bool = False):
+        """Return a slot and adapt the limit to the observed call"""
+        self.in_flight -= 1
+        self.completed += 1
+        now = time.monotonic()
+        slow = False
+        if not overloaded:
+            if self.baseline is None:
+                self.baseline = latency
+            slow = latency > max(self.latency_target, self.baseline * self.tolerance)
+            self.baseline += self.smoothing * (latency - self.baseline)
+        if overloaded or slow:
+            # Decrease at most once per latency window, so one burst of slow
+            # calls does not collapse the limit to the floor
+            if now - self._last_decrease > self.latency_target:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = now
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self._wake()
+
+    def _wake(self):
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold a slot for the duration of one Odoo call"""
+        await self.acquire()
+        started = time.perf_counter()
+        overloaded = False
+        try:
+            yield
+        except OVERLOAD_ERRORS:
+            overloaded = True
+            raise
+        finally:
+            self.release(time.perf_counter() - started, overloaded)
+
+    def stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "baseline": round(self.baseline, 3) if self.baseline is not None else None,
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+
+
+def get_limiter(endpoint: str) -> AdaptiveLimiter:
+    """Process-wide limiter for one Odoo endpoint"""
+    limiter = _limiters.get(endpoint)
+    if limiter is None:
+        limiter = _limiters[endpoint] = AdaptiveLimiter()
+    return limiter
+
+
+def limiter_stats() -> Dict[str, dict]:
+    return {endpoint: limiter.stats() for endpoint, limiter in _limiters.items()}
@@ -0,0 +1,73 @@
+"""Cached Odoo field metadata (fields_get) and field-list pruning"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+# Expensive to read and transfer; only fetched when explicitly asked for
+HEAVY_FIELD_TYPES = frozenset({"binary", "html", "one2many"})
+
+
+class FieldMetadataCache:
+    """Lazily loaded, TTL-refreshed `fields_get` result per model
+
+    Keyed by the connection's uid as well as the model, because Odoo hides
+    group-restricted fields from users outside those groups. At most
+    `max_size` entries are kept, least recently used dropped first, so memory
+    stays flat however many users log in.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_size: Optional[int] = None):
+        self.ttl = ttl or settings.ODOO_FIELDS_CACHE_TTL
+        self.max_size = max_size or settings.ODOO_FIELDS_CACHE_SIZE
+        self._fields: "OrderedDict[Tuple, Tuple[float, Dict[str, dict]]]" = OrderedDict()
+
+    async def get_fields(self, odoo, model: str) -> Dict[str, dict]:
+        """Field name -> attributes (`type`, `store`) for `model`"""
+        key = (getattr(odoo, "uid", None), model)
+        cached = self._fields.get(key)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            self._fields.move_to_end(key)
+            return cached[1]
+
+        fields = await odoo.execute_kw(
+            model=model,
+            method="fields_get",
+            args=[],
+            kwargs={"attributes": ["type", "store"]},
+        )
+        self._fields[key] = (time.monotonic(), fields)
+        self._fields.move_to_end(key)
+        while len(self._fields) > self.max_size:
+            self._fields.popitem(last=False)
+        return fields
+
+    async def prune(
+        self, odoo, model: str, fields: Iterable[str], include: Iterable[str] = ()
+    ) -> List[str]:
+        """Keep only real fields of `model`, dropping heavy ones unless included"""
+        fields = list(fields)
+        try:
+            available = await self.get_fields(odoo, model)
+        except Exception as err:
+            # Without metadata, read the fields as requested
+            logger.warning("fields_get failed", model=model, error=str(err))
+            return fields
+
+        include = set(include)
+        return [
+            name
+            for name in fields
+            if name in available
+            and (name in include or available[name].get("type") not in HEAVY_FIELD_TYPES)
+        ]
+
+
+# Global field metadata cache
+field_metadata = FieldMetadataCache()
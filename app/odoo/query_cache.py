@@ -0,0 +1,139 @@
+"""Read-through Redis cache for Odoo search_read / read results"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+import structlog
+
+from app.cache.redis_client import redis_client
+from app.config import settings
+from app.odoo.domain import query_fingerprint
+from app.odoo.exceptions import OdooUnavailableError
+from app.utils.model_name import Method
+
+logger = structlog.get_logger()
+
+
+class QueryCache:
+    """Cache query results in Redis, keyed by query fingerprint
+
+    A cached entry is revalidated on every hit with a cheap stamp: the
+    domain's record count and latest write_date, fetched with `search_count`
+    and a one-row `search_read` (`read_group` on write_date is refused on some
+    models, e.g. ir.attachment for non-system users). The full query only runs
+    again when that stamp changed. While Odoo is unavailable the last cached
+    result is served as is. Models whose stamp fails are not cached from then
+    on, so their reads cost a single RPC.
+    """
+
+    prefix = "odoo:query"
+
+    def __init__(self, redis=None):
+        self.redis = redis or redis_client
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stale = 0
+        self.uncacheable: set = set()
+
+    @staticmethod
+    def ttl(model: str) -> int:
+        """Cache lifetime for `model` in seconds; 0 disables caching"""
+        return settings.ODOO_QUERY_CACHE_MODEL_TTLS.get(
+            model, settings.ODOO_QUERY_CACHE_TTL
+        )
+
+    async def _stamp(self, odoo, model: str, domain: List) -> List:
+        count, latest = await asyncio.gather(
+            odoo.execute_kw(model=model, method="search_count", args=[domain]),
+            odoo.execute_kw(
+                model=model,
+                method=Method.SEARCH_READ,
+                args=[domain],
+                kwargs={"fields": ["write_date"], "order": "write_date desc", "limit": 1},
+            ),
+        )
+        return [count, latest[0]["write_date"] if latest else None]
+
+    async def search_read(
+        self,
+        odoo,
+        model: str,
+        domain: List,
+        fields: List[str],
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[Dict]:
+        """`search_read` through the cache"""
+        kwargs = {"fields": fields}
+        for name, value in (("order", order), ("limit", limit), ("offset", offset)):
+            if value:
+                kwargs[name] = value
+
+        ttl = self.ttl(model)
+        if not ttl or model in self.uncacheable:
+            return await odoo.execute_kw(
+                model=model, method=Method.SEARCH_READ, args=[domain], kwargs=kwargs
+            )
+
+        # Results depend on record rules, so entries are per Odoo user
+        key = "%s:%s:%s" % (
+            self.prefix,
+            getattr(odoo, "uid", None),
+            query_fingerprint(model, Method.SEARCH_READ, domain, fields, order, limit, offset),
+        )
+        entry = await self.redis.get(key)
+        try:
+            # Stamp before fetching: a write landing in between is caught
+            # by the next revalidation instead of being cached as current
+            stamp = await self._stamp(odoo, model, domain)
+        except OdooUnavailableError:
+            if entry:
+                self.stale += 1
+                return entry["records"]
+            raise
+        except Exception as err:
+            logger.warning(
+                "Query cache revalidation failed, not caching model",
+                model=model,
+                error=str(err),
+            )
+            self.uncacheable.add(model)
+            stamp = None
+
+        if entry and stamp is not None and entry["stamp"] == stamp:
+            self.hits += 1
+            return entry["records"]
+
+        if entry:
+            self.revalidated += 1
+        else:
+            self.misses += 1
+        records = await odoo.execute_kw(
+            model=model, method=Method.SEARCH_READ, args=[domain], kwargs=kwargs
+        )
+        if stamp is not None:
+            await self.redis.set(key, {"stamp": stamp, "records": records}, expire=ttl)
+        return records
+
+    async def read(
+        self, odoo, model: str, record_ids: List[int], fields: List[str]
+    ) -> List[Dict]:
+        """`read` through the cache, in the order of `record_ids`"""
+        records = await self.search_read(odoo, model, [("id", "in", record_ids)], fields)
+        by_id = {record["id"]: record for record in records}
+        return [by_id[record_id] for record_id in record_ids if record_id in by_id]
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "stale": self.stale,
+            "uncacheable": sorted(self.uncacheable),
+        }
+
+
+# Global Odoo query cache
+query_cache = QueryCache()
@@ -0,0 +1,130 @@
+"""Field-level Redis cache of individual Odoo records"""
+
+from typing import Dict, FrozenSet, Iterable, List, Union
+
+import structlog
+
+from app.cache.redis_client import redis_client
+from app.config import settings
+from app.utils.model_name import Method
+
+logger = structlog.get_logger()
+
+
+class RecordStore:
+    """Cache Odoo records as one Redis hash per (model, id)
+
+    Hash fields are `<uid>:<field>`, since record rules and field groups make
+    what a user may read user-specific, while a single DEL still drops a record
+    for every user. Reads fetch only the ids and fields missing from the cache.
+    Ids Odoo did not return are remembered per model for a short while, so
+    repeated lookups of deleted records do not reach Odoo.
+    """
+
+    prefix = "odoo:record"
+
+    def __init__(self, redis=None):
+        self.redis = redis or redis_client
+        self.hits = 0
+        self.fetched = 0
+        self.missing = 0
+
+    def _key(self, model: str, record_id: int) -> str:
+        return "%s:%s:%s" % (self.prefix, model, record_id)
+
+    def _missing_key(self, model: str) -> str:
+        return "%s:%s:missing" % (self.prefix, model)
+
+    async def read(
+        self, odoo, model: str, record_ids: Iterable[int], fields: List[str]
+    ) -> List[Dict]:
+        """Records with `fields`, in the order of `record_ids`, skipping missing ids"""
+        record_ids = list(dict.fromkeys(record_ids))
+        if not record_ids:
+            return []
+        if not settings.ODOO_RECORD_CACHE_TTL:
+            return await self._fetch(odoo, model, record_ids, fields)
+
+        uid = getattr(odoo, "uid", None)
+        names = ["%s:%s" % (uid, field) for field in fields]
+        rows = await self.redis.get_hash_fields_many(
+            [(self._key(model, record_id), names) for record_id in record_ids]
+            + [(self._missing_key(model), ["%s:%s" % (uid, rid) for rid in record_ids])]
+        )
+        missing = rows.pop()
+
+        records: Dict[int, Dict] = {}
+        wanted: Dict[FrozenSet[str], List[int]] = {}
+        for record_id, row in zip(record_ids, rows):
+            if "%s:%s" % (uid, record_id) in missing:
+                continue
+            record = {"id": record_id}
+            for field, name in zip(fields, names):
+                if name in row:
+                    record[field] = row[name]
+            records[record_id] = record
+            absent = frozenset(field for field in fields if field not in record)
+            if absent:
+                wanted.setdefault(absent, []).append(record_id)
+            else:
+                self.hits += 1
+
+        # One read per distinct set of missing fields, usually just one
+        updates, not_found = {}, {}
+        for absent, ids in wanted.items():
+            fetched = {
+                record["id"]: record
+                for record in await self._fetch(odoo, model, ids, sorted(absent))
+            }
+            self.fetched += len(fetched)
+            for record_id in ids:
+                if record_id not in fetched:
+                    records.pop(record_id)
+                    not_found["%s:%s" % (uid, record_id)] = True
+                    continue
+                record = fetched[record_id]
+                records[record_id].update(record)
+                updates[self._key(model, record_id)] = {
+                    "%s:%s" % (uid, field): record[field]
+                    for field in absent
+                    if field in record
+                }
+
+        if updates:
+            await self.redis.set_hashes(updates, expire=settings.ODOO_RECORD_CACHE_TTL)
+        if not_found:
+            self.missing += len(not_found)
+            await self.redis.set_hashes(
+                {self._missing_key(model): not_found},
+                expire=settings.ODOO_RECORD_MISSING_TTL,
+            )
+        return [records[record_id] for record_id in record_ids if record_id in records]
+
+    async def _fetch(
+        self, odoo, model: str, record_ids: List[int], fields: List[str]
+    ) -> List[Dict]:
+        return await odoo.execute_kw(
+            model=model,
+            method=Method.SEARCH_READ,
+            args=[[("id", "in", record_ids)]],
+            kwargs={"fields": fields},
+        )
+
+    async def invalidate(self, model: str, record_ids: Union[int, Iterable[int]]):
+        """Drop cached records after they were written or deleted"""
+        if isinstance(record_ids, int):
+            record_ids = [record_ids]
+        keys = [self._key(model, record_id) for record_id in record_ids]
+        if keys:
+            await self.redis.delete_many(*keys)
+
+    async def invalidate_missing(self, model: str):
+        """Forget ids cached as missing, e.g. once records were created"""
+        await self.redis.delete(self._missing_key(model))
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "fetched": self.fetched, "missing": self.missing}
+
+
+# Global Odoo record store
+record_store = RecordStore()
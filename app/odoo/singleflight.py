@@ -0,0 +1,68 @@
+"""Coalescing of identical concurrent Odoo reads"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from app.odoo.domain import fingerprint_call
+
+# Methods that never change data in Odoo, and are therefore safe to share
+READ_METHODS = frozenset(
+    {
+        "search",
+        "search_read",
+        "search_count",
+        "read",
+        "read_group",
+        "name_search",
+        "fields_get",
+    }
+)
+
+
+def flight_key(scope: tuple, model: str, method: str, args: list, kwargs: dict) -> str:
+    """Deterministic key for an Odoo call within one credential scope"""
+    return ":".join(map(str, scope)) + ":" + fingerprint_call(model, method, args, kwargs)
+
+
+class SingleFlight:
+    """Share one in-flight call, and its result, between identical callers
+
+    The first caller starts the call as a task; later callers with the same key
+    await that task until it finishes. Results are shared, not copied, so
+    callers must treat them as read-only.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.started = 0
+        self.shared = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.shared += 1
+        # A cancelled caller must not cancel the call for everyone else
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._calls),
+            "started": self.started,
+            "shared": self.shared,
+        }
+
+
+# Global coalescer for Odoo reads
+odoo_singleflight = SingleFlight()
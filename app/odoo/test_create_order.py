@@ -0,0 +1,50 @@
+import pytest
+
+from app.odoo.client import OdooClient
+from app.odoo.exceptions import OdooOrderConfirmError
+
+
+@pytest.fixture
+def client():
+    return OdooClient("http://odoo.test", "odoo", "admin", "admin", uid=2)
+
+
+@pytest.mark.asyncio
+async def test_order_and_lines_are_created_in_one_call(client):
+    calls = []
+
+    async def execute_kw(model, method, args, kwargs=None):
+        calls.append((model, method, args))
+        return 7
+
+    client.execute_kw = execute_kw
+    order_id = await client.create_sale_order_with_lines(
+        {"partner_id": 3}, [{"product_id": 1}, (4, 9)], confirm=True
+    )
+
+    assert order_id == 7
+    assert calls == [
+        (
+            "sale.order",
+            "create",
+            [{"partner_id": 3, "order_line": [(0, 0, {"product_id": 1}), (4, 9)]}],
+        ),
+        ("sale.order", "action_confirm", [[7]]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_confirm_reports_the_created_order(client):
+    async def execute_kw(model, method, args, kwargs=None):
+        if method == "button_confirm":
+            raise Exception("UserError: no vendor")
+        return 42
+
+    client.execute_kw = execute_kw
+    with pytest.raises(OdooOrderConfirmError) as raised:
+        await client.create_purchase_order_with_lines(
+            {"partner_id": 3}, [{"product_id": 1}], confirm=True
+        )
+
+    assert raised.value.order_id == 42
+    assert "no vendor" in str(raised.value.cause)
@@ -0,0 +1,70 @@
+import pytest
+
+from app.config import settings
+from app.odoo.client import OdooClient
+from app.odoo.exceptions import OdooBulkCreateError, OdooUnavailableError
+
+
+class FakeCreate:
+    """Odoo `create` stand-in: a call fails as a whole if any row is `bad`"""
+
+    def __init__(self, down_after=None):
+        self.next_id = 100
+        self.calls = []
+        self.down_after = down_after
+
+    async def __call__(self, model, method, args, kwargs=None):
+        rows = args[0]
+        self.calls.append(len(rows))
+        if self.down_after is not None and len(self.calls) > self.down_after:
+            raise OdooUnavailableError("Odoo is unreachable")
+        if any(row.get("bad") for row in rows):
+            raise Exception("ValidationError: bad row")
+        ids = list(range(self.next_id, self.next_id + len(rows)))
+        self.next_id += len(rows)
+        return ids
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "ODOO_CHUNK_SIZE", 4)
+    monkeypatch.setattr(settings, "ODOO_CREATE_CHUNK_BYTES", 1_000_000)
+    return OdooClient("http://odoo.test", "odoo", "admin", "admin", uid=2)
+
+
+@pytest.mark.asyncio
+async def test_create_records_chunks_and_keeps_order(client):
+    client.execute_kw = fake = FakeCreate()
+
+    ids = await client.create_records("stock.quant", [{"n": i} for i in range(10)])
+
+    assert fake.calls == [4, 4, 2]
+    assert ids == list(range(100, 110))
+
+
+@pytest.mark.asyncio
+async def test_create_records_isolates_bad_rows(client):
+    client.execute_kw = FakeCreate()
+    rows = [{"n": i, "bad": i in (2, 5)} for i in range(8)]
+
+    with pytest.raises(OdooBulkCreateError) as raised:
+        await client.create_records("stock.quant", rows)
+
+    ids = raised.value.ids
+    assert len(ids) == len(rows)
+    assert [index for index, record_id in enumerate(ids) if record_id is None] == [2, 5]
+    assert sorted(raised.value.errors) == [2, 5]
+    # The good rows are created, their ids in submission order
+    created = [record_id for record_id in ids if record_id is not None]
+    assert created == sorted(created)
+
+
+@pytest.mark.asyncio
+async def test_create_records_stops_when_odoo_is_down(client):
+    client.execute_kw = FakeCreate(down_after=1)
+
+    with pytest.raises(OdooBulkCreateError) as raised:
+        await client.create_records("stock.quant", [{"n": i} for i in range(10)])
+
+    assert raised.value.ids == [100, 101, 102, 103] + [None] * 6
+    assert sorted(raised.value.errors) == list(range(4, 10))
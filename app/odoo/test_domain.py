@@ -0,0 +1,72 @@
+import pytest
+
+from app.odoo.domain import fingerprint_call, normalize_domain, query_fingerprint
+
+
+def test_normalize_sorts_and_dedupes_in_values():
+    assert normalize_domain([("id", "in", (3, 1, 2, 3))]) == [("id", "in", [1, 2, 3])]
+    assert normalize_domain([("id", "in", 5)]) == [("id", "in", [5])]
+
+
+def test_normalize_unifies_operator_forms():
+    assert normalize_domain([("state", "==", "done")]) == normalize_domain(
+        [["state", "=", "done"]]
+    )
+    assert normalize_domain([("state", "<>", "done")]) == [("state", "!=", "done")]
+    assert normalize_domain([("name", "ILIKE", "x")]) == [("name", "ilike", "x")]
+
+
+def test_normalize_flattens_and_orders_operands():
+    a, b, c = ("a", "=", 1), ("b", "=", 2), ("c", "=", 3)
+    implicit = normalize_domain([a, b, c])
+    assert normalize_domain(["&", a, "&", b, c]) == implicit
+    assert normalize_domain([c, "&", b, a]) == implicit
+    assert normalize_domain(["|", a, "|", b, c]) == normalize_domain(["|", "|", c, b, a])
+    assert normalize_domain(["!", "!", a]) == [a]
+
+
+def test_normalize_rejects_malformed_domains():
+    with pytest.raises(ValueError, match="lacks an operand"):
+        normalize_domain(["|", ("a", "=", 1)])
+    with pytest.raises(ValueError, match="lacks an operand"):
+        normalize_domain(["!"])
+    with pytest.raises(ValueError, match="Malformed domain term"):
+        normalize_domain([("a", "=")])
+
+
+def test_normalize_keeps_or_semantics():
+    a, b, c = ("a", "=", 1), ("b", "=", 2), ("c", "=", 3)
+    # (a | b) & c must not become a | (b & c)
+    assert normalize_domain(["|", a, b, c]) != normalize_domain(["|", a, "&", b, c])
+
+
+def test_query_fingerprint_is_stable():
+    first = query_fingerprint(
+        "project.task",
+        "search_read",
+        [("project_id", "in", [2, 1])],
+        fields=["name", "id"],
+        order="id  ASC",
+        limit=10,
+    )
+    second = query_fingerprint(
+        "project.task",
+        "search_read",
+        [["project_id", "in", [1, 2]]],
+        fields=["id", "name"],
+        order="id asc",
+        limit=10,
+    )
+    assert first == second
+    assert len(first) == 24
+    assert first != query_fingerprint("project.task", "search_read", [], limit=10)
+
+
+def test_fingerprint_call_matches_query_fingerprint():
+    domain = [("id", "in", [1, 2])]
+    assert fingerprint_call(
+        "res.users", "search_read", [domain], {"fields": ["name"]}
+    ) == query_fingerprint("res.users", "search_read", domain, ["name"])
+    assert fingerprint_call(
+        "res.users", "search_read", [domain], {"context": {"lang": "fr_FR"}}
+    ) != fingerprint_call("res.users", "search_read", [domain], {})
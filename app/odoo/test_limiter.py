@@ -0,0 +1,46 @@
+from unittest import mock
+
+from app.odoo.limiter import AdaptiveLimiter
+
+
+def make_limiter():
+    return AdaptiveLimiter(
+        initial=8, min_limit=1, max_limit=64, latency_target=2.0,
+        queue_size=10, queue_timeout=1.0,
+    )
+
+
+def run_calls(limiter, latencies, clock):
+    for latency in latencies:
+        limiter.in_flight += 1
+        clock[0] += latency
+        limiter.release(latency)
+
+
+def test_steady_slow_calls_do_not_drive_the_limit_down():
+    limiter = make_limiter()
+    clock = [0.0]
+    with mock.patch("app.odoo.limiter.time.monotonic", lambda: clock[0]):
+        run_calls(limiter, [5.0] * 200, clock)
+
+    assert limiter.limit > 8
+    assert 4.9 < limiter.baseline < 5.1
+
+
+def test_latency_spike_over_baseline_backs_off():
+    limiter = make_limiter()
+    clock = [0.0]
+    with mock.patch("app.odoo.limiter.time.monotonic", lambda: clock[0]):
+        run_calls(limiter, [0.5] * 50, clock)
+        before = limiter.limit
+        run_calls(limiter, [3.0] * 20, clock)
+
+    assert limiter.limit < before
+
+
+def test_transport_errors_back_off():
+    limiter = make_limiter()
+    limiter.in_flight = 1
+    limiter.release(0.1, overloaded=True)
+
+    assert limiter.limit < 8
@@ -0,0 +1,28 @@
+import pytest
+
+from app.odoo.metadata import FieldMetadataCache
+
+
+class FakeOdoo:
+    calls = 0
+
+    def __init__(self, uid):
+        self.uid = uid
+
+    async def execute_kw(self, model, method, args, kwargs=None):
+        FakeOdoo.calls += 1
+        return {"name": {"type": "char", "store": True}}
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_and_keeps_recent_users():
+    cache = FieldMetadataCache(ttl=60, max_size=2)
+    FakeOdoo.calls = 0
+
+    await cache.get_fields(FakeOdoo(1), "project.task")
+    await cache.get_fields(FakeOdoo(2), "project.task")
+    await cache.get_fields(FakeOdoo(1), "project.task")  # hit, now most recent
+    await cache.get_fields(FakeOdoo(3), "project.task")  # evicts uid 2
+
+    assert FakeOdoo.calls == 3
+    assert list(cache._fields) == [(1, "project.task"), (3, "project.task")]
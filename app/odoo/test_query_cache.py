@@ -0,0 +1,64 @@
+import pytest
+
+from app.odoo.query_cache import QueryCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, expire=None):
+        self.data[key] = value
+        return True
+
+
+class FakeOdoo:
+    uid = 2
+
+    def __init__(self, records, stamp_error=None):
+        self.records = records
+        self.stamp_error = stamp_error
+        self.calls = []
+
+    async def execute_kw(self, model, method, args, kwargs=None):
+        kwargs = kwargs or {}
+        stamping = method == "search_count" or kwargs.get("fields") == ["write_date"]
+        self.calls.append("stamp" if stamping else method)
+        if stamping and self.stamp_error:
+            raise self.stamp_error
+        if method == "search_count":
+            return len(self.records)
+        if stamping:
+            return [{"id": 1, "write_date": "2026-01-01 10:00:00"}]
+        return self.records
+
+
+@pytest.mark.asyncio
+async def test_unchanged_stamp_serves_cached_records():
+    cache, odoo = QueryCache(FakeRedis()), FakeOdoo([{"id": 1, "name": "a"}])
+
+    first = await cache.search_read(odoo, "project.task", [], ["name"])
+    odoo.calls.clear()
+    second = await cache.search_read(odoo, "project.task", [], ["name"])
+
+    assert first == second == [{"id": 1, "name": "a"}]
+    assert odoo.calls == ["stamp", "stamp"]
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_stamp_stops_caching_the_model():
+    cache = QueryCache(FakeRedis())
+    odoo = FakeOdoo([{"id": 9, "name": "f.pdf"}], stamp_error=Exception("AccessError"))
+
+    await cache.search_read(odoo, "ir.attachment", [], ["name"])
+    odoo.calls.clear()
+    records = await cache.search_read(odoo, "ir.attachment", [], ["name"])
+
+    assert records == [{"id": 9, "name": "f.pdf"}]
+    # No stamp attempt, and no extra RPC, once the model is known to fail
+    assert odoo.calls == ["search_read"]
+    assert cache.stats()["uncacheable"] == ["ir.attachment"]
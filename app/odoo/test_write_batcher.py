@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from app.odoo.write_batcher import WriteBatcher
+
+
+class FakeClient:
+    """Records `write` RPCs; rejects any write setting a `bad` value"""
+
+    def __init__(self):
+        self.calls = []
+
+    def _scope(self):
+        return ("scope",)
+
+    async def _call_kw(self, model, method, args, kwargs):
+        self.calls.append((method, args[0], dict(args[1])))
+        if "bad" in args[1]:
+            raise Exception("ValidationError: invalid field 'bad'")
+        return True
+
+
+@pytest.mark.asyncio
+async def test_writes_in_window_are_merged_and_grouped():
+    client, batcher = FakeClient(), WriteBatcher(window=0.01, max_size=100)
+
+    results = await asyncio.gather(
+        batcher.write(client, "project.task", 1, {"progress": 50}),
+        batcher.write(client, "project.task", 2, {"progress": 50}),
+        batcher.write(client, "project.task", 1, {"name": "Renamed"}),
+    )
+
+    assert results == [True, True, True]
+    assert sorted(client.calls, key=lambda call: call[1]) == [
+        ("write", [1], {"progress": 50, "name": "Renamed"}),
+        ("write", [2], {"progress": 50}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_identical_values_share_one_rpc():
+    client, batcher = FakeClient(), WriteBatcher(window=0.01, max_size=100)
+
+    await asyncio.gather(
+        *(batcher.write(client, "project.task", i, {"stage_id": 3}) for i in range(5))
+    )
+
+    assert client.calls == [("write", [0, 1, 2, 3, 4], {"stage_id": 3})]
+    assert batcher.stats()["rpcs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_write_does_not_fail_merged_callers():
+    client, batcher = FakeClient(), WriteBatcher(window=0.01, max_size=100)
+
+    good, bad = await asyncio.gather(
+        batcher.write(client, "project.task", 1, {"progress": 50}),
+        batcher.write(client, "project.task", 1, {"bad": 1}),
+        return_exceptions=True,
+    )
+
+    assert good is True
+    assert isinstance(bad, Exception) and "bad" in str(bad)
+    # The merged write failed, then each caller's own values were replayed
+    assert client.calls[1:] == [
+        ("write", [1], {"progress": 50}),
+        ("write", [1], {"bad": 1}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failing_group_only_fails_its_own_caller():
+    client, batcher = FakeClient(), WriteBatcher(window=0.01, max_size=100)
+
+    results = await asyncio.gather(
+        batcher.write(client, "project.task", 2, {"bad": 1}),
+        batcher.write(client, "project.task", 3, {"progress": 10}),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], Exception)
+    assert results[1] is True
+    # An unmerged write is not sent twice
+    assert len(client.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_multi_record_write_is_not_split_across_groups(monkeypatch):
+    from app.odoo import client as client_module
+    from app.odoo.client import OdooClient
+
+    batcher = WriteBatcher(window=0.01, max_size=100)
+    monkeypatch.setattr(client_module, "write_batcher", batcher)
+    calls = []
+
+    async def call_kw(self, model, method, args, kwargs):
+        calls.append((method, args[0], dict(args[1])))
+        return True
+
+    async def invalidate(model, ids):
+        pass
+
+    monkeypatch.setattr(OdooClient, "_call_kw", call_kw)
+    monkeypatch.setattr(client_module.record_store, "invalidate", invalidate)
+    odoo = OdooClient("http://odoo", "odoo", "admin", "secret", uid=2)
+
+    await asyncio.gather(
+        odoo.execute_kw("project.task", "write", [[1, 2], {"stage_id": 3}]),
+        odoo.execute_kw("project.task", "write", [[1], {"name": "Renamed"}]),
+    )
+
+    # The two-record write went out whole; only the single-record one was queued
+    assert sorted(calls) == [
+        ("write", [1], {"name": "Renamed"}),
+        ("write", [1, 2], {"stage_id": 3}),
+    ]
+    assert batcher.stats()["writes"] == 1
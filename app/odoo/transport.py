@@ -0,0 +1,201 @@
+"""Non-blocking HTTP transports for Odoo RPC"""
+
+import itertools
+import json
+import xmlrpc.client
+from datetime import date, datetime, timezone
+from typing import Any, Optional
+from urllib.parse import urljoin, urlsplit
+
+import aiohttp
+
+from app.config import settings
+from app.odoo.http_pool import odoo_http_pool
+from app.odoo.circuit_breaker import get_breaker
+from app.odoo.exceptions import OdooOverloadedError, OdooUnavailableError
+from app.odoo.limiter import OVERLOAD_ERRORS, get_limiter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+XMLRPC = "xmlrpc"
+JSONRPC = "jsonrpc"
+
+
+def _odoo_value(value: Any) -> str:
+    """JSON form of values Odoo fields expect as strings: dates and UTC datetimes"""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        # orjson would write ISO 8601 ("T" separator), which Odoo rejects
+        return orjson.dumps(
+            value, default=_odoo_value, option=orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return json.dumps(value, default=_odoo_value).encode("utf-8")
+
+
+def _json_loads(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+class JsonRpcError(Exception):
+    """Error returned by Odoo's /jsonrpc endpoint"""
+
+    def __init__(self, error: dict):
+        data = error.get("data") or {}
+        self.code = error.get("code")
+        self.name = data.get("name")
+        self.debug = data.get("debug")
+        super().__init__(data.get("message") or error.get("message") or str(error))
+
+
+# Fault code of odoo.exceptions.AccessDenied on Odoo's /xmlrpc/2 endpoints
+XMLRPC_ACCESS_DENIED = 3
+
+
+def is_access_denied(err: Exception) -> bool:
+    """Whether Odoo rejected the call's credentials, as opposed to the call itself
+
+    Follows `__cause__`, as the client wraps transport errors.
+    """
+    while err.__cause__ is not None and not isinstance(
+        err, (xmlrpc.client.Fault, JsonRpcError)
+    ):
+        err = err.__cause__
+    if isinstance(err, xmlrpc.client.Fault):
+        return err.faultCode == XMLRPC_ACCESS_DENIED
+    if isinstance(err, JsonRpcError):
+        return err.name == "odoo.exceptions.AccessDenied"
+    return False
+
+
+class _HttpTransport:
+    """Shared request handling for the Odoo transports"""
+
+    def __init__(self, url: str, timeout: Optional[float] = None):
+        self.url = url
+        self.endpoint = "{0.scheme}://{0.netloc}".format(urlsplit(url))
+        # A short connect timeout makes an unreachable Odoo fail fast
+        self.timeout = aiohttp.ClientTimeout(
+            total=timeout or settings.ODOO_RPC_TIMEOUT,
+            sock_connect=settings.ODOO_CONNECT_TIMEOUT,
+        )
+
+    async def _post(self, path: str, data: bytes, content_type: str) -> bytes:
+        """POST to Odoo over the shared keep-alive pool and return the body"""
+        async with odoo_http_pool.post(
+            urljoin(self.url, path),
+            data=data,
+            headers={"Content-Type": content_type},
+            timeout=self.timeout,
+        ) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def call(self, service: str, method: str, *args) -> Any:
+        """Call `method` on an Odoo RPC service (`common`, `object`, ...)"""
+        breaker = get_breaker(self.endpoint)
+        breaker.before_call()
+        try:
+            async with get_limiter(self.endpoint).slot():
+                result = await self._call(service, method, *args)
+        except OVERLOAD_ERRORS as err:
+            breaker.record_failure()
+            raise OdooUnavailableError(f"Odoo is unreachable: {err!r}") from err
+        except OdooOverloadedError:
+            # Shed locally before reaching Odoo: says nothing about its health
+            breaker.record_abandoned()
+            raise
+        except Exception:
+            # Odoo answered, with a fault: it is up
+            breaker.record_success()
+            raise
+        except BaseException:
+            # The caller went away before Odoo answered
+            breaker.record_abandoned()
+            raise
+        breaker.record_success()
+        return result
+
+    async def _call(self, service: str, method: str, *args) -> Any:
+        raise NotImplementedError
+
+    async def close(self):
+        """Kept for API compatibility; connections belong to `odoo_http_pool`"""
+
+
+class XmlRpcTransport(_HttpTransport):
+    """Async XML-RPC transport for Odoo built on aiohttp"""
+
+    async def _call(self, service: str, method: str, *args) -> Any:
+        payload = xmlrpc.client.dumps(args, method, allow_none=True)
+        body = await self._post(
+            f"/xmlrpc/2/{service}", payload.encode("utf-8"), "text/xml"
+        )
+
+        # Raises xmlrpc.client.Fault for Odoo-side errors, like ServerProxy
+        result, _ = xmlrpc.client.loads(body)
+        return result[0]
+
+
+class JsonRpcTransport(_HttpTransport):
+    """Async transport for Odoo's /jsonrpc endpoint
+
+    Returns the same Python structures as XML-RPC (lists for many2one pairs,
+    strings for dates) while sending a much smaller payload.
+    """
+
+    _ids = itertools.count(1)
+
+    async def _call(self, service: str, method: str, *args) -> Any:
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": list(args)},
+            "id": next(self._ids),
+        }
+        body = await self._post("/jsonrpc", _json_dumps(payload), "application/json")
+
+        reply = _json_loads(body)
+        if reply.get("error"):
+            raise JsonRpcError(reply["error"])
+        return reply.get("result")
+
+
+class ServiceProxy:
+    """Async stand-in for `xmlrpc.client.ServerProxy` on one Odoo service
+
+    `await ServiceProxy(transport, "object").execute_kw(db, uid, pwd, ...)`
+    """
+
+    def __init__(self, transport: _HttpTransport, service: str):
+        self._transport = transport
+        self._service = service
+
+    def __getattr__(self, method: str):
+        async def _call(*args):
+            return await self._transport.call(self._service, method, *args)
+
+        return _call
+
+
+def make_transport(url: str, transport: Optional[str] = None) -> _HttpTransport:
+    """Build the Odoo transport selected by `transport` or `ODOO_TRANSPORT`"""
+    transport = transport or settings.ODOO_TRANSPORT
+    if transport == JSONRPC:
+        return JsonRpcTransport(url)
+    if transport == XMLRPC:
+        return XmlRpcTransport(url)
+    raise ValueError(f"Unknown Odoo transport: {transport}")
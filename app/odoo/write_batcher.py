@@ -0,0 +1,130 @@
+"""Coalescing of Odoo `write` calls made within a short window"""
+
+import asyncio
+import json
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.odoo.exceptions import OdooUnavailableError
+
+
+class _Batch:
+    def __init__(self, client):
+        self.client = client
+        self.values: Dict[int, dict] = {}
+        # (future, record id, values) of every queued write, in arrival order
+        self.callers: List[Tuple[asyncio.Future, int, dict]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class WriteBatcher:
+    """Group pending single-record writes per (credential scope, model)
+
+    Writes to the same record are merged, later values winning; records ending
+    up with identical values are then written with one `write(ids, vals)`. If a
+    grouped write fails, the writes merged into it are replayed unmerged, in
+    arrival order, so every caller gets the outcome of its own values.
+
+    Only single-record writes are queued: a multi-record write is already one
+    RPC, and splitting its ids across groups would let part of it commit while
+    the rest fails.
+    """
+
+    def __init__(self, window: Optional[float] = None, max_size: Optional[int] = None):
+        self.window = settings.ODOO_WRITE_BATCH_WINDOW if window is None else window
+        self.max_size = max_size or settings.ODOO_WRITE_BATCH_MAX
+        self._batches: Dict[tuple, _Batch] = {}
+        self.writes = 0
+        self.rpcs = 0
+
+    async def write(self, client, model: str, record_id: int, values: dict) -> bool:
+        """Queue a write and wait for the outcome of the batch containing it"""
+        loop = asyncio.get_running_loop()
+        key = (client._scope(), model)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(client)
+            batch.timer = loop.call_later(self.window, self._flush, key)
+
+        future = loop.create_future()
+        batch.values.setdefault(record_id, {}).update(values)
+        batch.callers.append((future, record_id, dict(values)))
+        self.writes += 1
+        if len(batch.values) >= self.max_size:
+            batch.timer.cancel()
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: tuple):
+        batch = self._batches.pop(key, None)
+        if batch is not None:
+            asyncio.ensure_future(self._send(batch, key[1]))
+
+    async def _send(self, batch: _Batch, model: str):
+        groups: Dict[str, Tuple[dict, List[int]]] = {}
+        for record_id, values in batch.values.items():
+            group_key = json.dumps(values, sort_keys=True, default=str)
+            groups.setdefault(group_key, (values, []))[1].append(record_id)
+
+        errors: Dict[int, Exception] = {}
+        await asyncio.gather(
+            *(
+                self._write_group(batch, model, ids, values, errors)
+                for values, ids in groups.values()
+            )
+        )
+        for index, (future, _, _) in enumerate(batch.callers):
+            if future.done():
+                continue
+            if index in errors:
+                future.set_exception(errors[index])
+            else:
+                future.set_result(True)
+
+    async def _write_group(
+        self,
+        batch: _Batch,
+        model: str,
+        record_ids: List[int],
+        values: dict,
+        errors: Dict[int, Exception],
+    ):
+        """Write one group; `errors` collects the first error of each caller"""
+        in_group = set(record_ids)
+        callers = [
+            index
+            for index, (_, record_id, _) in enumerate(batch.callers)
+            if record_id in in_group
+        ]
+        self.rpcs += 1
+        try:
+            await batch.client._call_kw(model, "write", [record_ids, values], {})
+        except OdooUnavailableError as err:
+            # Replaying the writes cannot help while Odoo is down
+            for index in callers:
+                errors.setdefault(index, err)
+        except Exception as err:
+            if len(callers) == 1:
+                # Nothing was merged: the caller's own write failed
+                errors.setdefault(callers[0], err)
+                return
+            for index in callers:
+                _, record_id, caller_values = batch.callers[index]
+                self.rpcs += 1
+                try:
+                    await batch.client._call_kw(
+                        model, "write", [[record_id], caller_values], {}
+                    )
+                except Exception as caller_err:
+                    errors.setdefault(index, caller_err)
+
+    def stats(self) -> dict:
+        return {
+            "pending": sum(len(batch.values) for batch in self._batches.values()),
+            "writes": self.writes,
+            "rpcs": self.rpcs,
+        }
+
+
+# Global Odoo write coalescer
+write_batcher = WriteBatcher()
@@ -34,7 +34,7 @@ router = APIRouter(
 async def create_project_from_frontend(
     project: ProjectCreate,
     odoo_connection=Depends(get_session_odoo_connection),
-    db_connection=Depends(db.connection),
+    db_connection=Depends(db.lazy_connection),
 ):
     """Create a new project from frontend and sync with Odoo"""
     controller = ProjectController(
@@ -49,7 +49,7 @@ async def get_project_dashboard(
     limit: int = 100,
     search: Optional[str] = None,
     odoo_connection=Depends(get_session_odoo_connection),
-    db_connection=Depends(db.connection),
+    db_connection=Depends(db.lazy_read_connection),
 ):
     """Get project dashboard data"""
     return await ProjectController(odoo_connection, db_connection).get_projects(
@@ -62,7 +62,7 @@ async def create_project_task(
     project_id: int,
     task_data: CreateProjectTaskSchema,
     odoo_connection=Depends(get_session_odoo_connection),
-    db_connection=Depends(db.connection),
+    db_connection=Depends(db.lazy_connection),
 ):
     """Create a new task in project from frontend and sync with Odoo"""
     return await ProjectController(odoo_connection, db_connection).create_task(
@@ -75,7 +75,7 @@ async def update_project_task_from_frontend(
     task_id: int,
     task_update: TaskUpdate,
     odoo_connection=Depends(get_session_odoo_connection),
-    db_connection=Depends(db.connection),
+    db_connection=Depends(db.lazy_connection),
 ):
     """Update task from frontend and sync with Odoo"""
 
@@ -89,7 +89,7 @@ async def create_task_timesheet_from_frontend(
     task_id: int,
     timesheet: TimesheetCreate,
     odoo_connection=Depends(get_session_odoo_connection),
-    db_connection=Depends(db.connection),
+    db_connection=Depends(db.lazy_connection),
 ):
     """Create timesheet for task from frontend and sync with Odoo"""
     return await ProjectController(odoo_connection, db_connection).create_timesheet(
@@ -102,7 +102,7 @@ async def upload_project_file_from_frontend(
     project_id: int,
     file: UploadFile = File(...),
     odoo_connection=Depends(get_session_odoo_connection),
-    db_connection=Depends(db.connection),
+    db_connection=Depends(db.lazy_connection),
 ):
     """Upload file to project from frontend and sync with Odoo"""
     return await ProjectController(odoo_connection, db_connection).initiate_file_upload(
@@ -114,7 +114,7 @@ async def upload_project_file_from_frontend(
 async def get_project_tasks_from_frontend(
     project_id: int,
     odoo_connection=Depends(get_session_odoo_connection),
-    db_connection=Depends(db.connection),
+    db_connection=Depends(db.lazy_read_connection),
 ):
     """Get all tasks for a project from frontend"""
     return await ProjectController(odoo_connection, db_connection).get_project(
@@ -126,7 +126,7 @@ async def get_project_tasks_from_frontend(
 async def get_project_task_from_frontend(
     task_id: int,
     odoo_connection=Depends(get_session_odoo_connection),
-    db_connection=Depends(db.connection),
+    db_connection=Depends(db.lazy_read_connection),
 ):
     """Get specific task details from frontend"""
 
@@ -140,7 +140,7 @@ async def update_project_from_frontend(
     project_id: int,
     project_update: ProjectUpdate,
     odoo_connection=Depends(get_session_odoo_connection),
-    db_connection=Depends(db.connection),
+    db_connection=Depends(db.lazy_connection),
 ):
     """Update project from frontend and sync with Odoo"""
     return ProjectController(odoo_connection, db_connection).update_project(
@@ -1,5 +1,6 @@
 """Frontend API router for project and task management with Odoo synchronization"""
 
+import asyncio
 import base64
 from typing import Any, Dict, List, Optional
 
@@ -10,9 +11,14 @@ from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from app.api.models.models import SyncResponse
 
 from app.auth.models.models import User
+from app.config import settings
+from app.odoo.dataloader import RecordLoader
+from app.odoo.metadata import field_metadata
+from app.odoo.query_cache import query_cache
 
 # Database dependency is now passed as parameter, not imported at module level
 from app.project.api.route_name import Route
+from app.project.crud.project_curd import PorjectCrud
 from app.project.models.model import (
     Attachment,
     FileUploadResponse,
@@ -31,8 +37,6 @@ from app.project.schemas.project import (
 )
 from app.utils.model_name import Method, ModelName
 
-# from app.config import settings
-
 # from app.project.services.projeect_service import ProjectService
 
 logger = structlog.get_logger()
@@ -47,6 +51,31 @@ class ProjectController:
         self.odoo = odoo_connection
         self.db = db_connection
         self.logger = logger
+        # Request-scoped loaders: batch and cache related-record lookups
+        self.user_loader = RecordLoader(
+            odoo_connection, ModelName.USER, list(User.model_fields.keys())
+        )
+        self.tag_loader = RecordLoader(
+            odoo_connection, ModelName.TAG, list(ProjectTag.model_fields.keys())
+        )
+        # Bounds the independent sub-queries one request runs at once
+        self._odoo_slots = asyncio.Semaphore(settings.ODOO_REQUEST_CONCURRENCY)
+        self.crud = PorjectCrud(db_connection, odoo_connection)
+
+    def _use_sql(self, endpoint: str) -> bool:
+        """Whether `endpoint` reads Odoo's tables directly instead of via RPC"""
+        return self.db is not None and endpoint in settings.ODOO_SQL_READ_ENDPOINTS
+
+    async def _fields(self, model: str, schema, include: tuple = ()) -> List[str]:
+        """Fields of `schema` that are real, light fields of the Odoo model"""
+        return await field_metadata.prune(
+            self.odoo, model, schema.model_fields.keys(), include
+        )
+
+    async def _bounded(self, coro):
+        """Await `coro` within the request's Odoo concurrency limit"""
+        async with self._odoo_slots:
+            return await coro
 
     def _create_sync_response(
         self,
@@ -69,24 +98,11 @@ class ProjectController:
         )
 
     async def get_user(self, user_ids: List[int]) -> List[User]:
-        user_fields = list(User.model_fields.keys())
-        domain = [("id", "in", user_ids)]
-        kwargs = {"fields": user_fields}
-        users = await self.odoo.execute_kw(
-            model=ModelName.USER,
-            method=Method.SEARCH_READ,
-            args=[domain],
-            kwargs=kwargs,
-        )
+        users = await self.user_loader.load_many(user_ids)
         return [User(**user) for user in users]
 
     async def get_tag(self, tag_ids: List[int]) -> List[ProjectTag]:
-        tag_fields = list(ProjectTag.model_fields.keys())
-        domain = [("id", "in", tag_ids)]
-        kwargs = {"fields": tag_fields}
-        tags = await self.odoo.execute_kw(
-            model=ModelName.TAG, method=Method.SEARCH_READ, args=[domain], kwargs=kwargs
-        )
+        tags = await self.tag_loader.load_many(tag_ids)
         return [ProjectTag(**tag) for tag in tags]
 
     async def create_project(
@@ -130,8 +146,7 @@ class ProjectController:
             return await self.odoo.execute_kw(
                 ModelName.TASK,
                 Method.WRITE,
-                args=[task_id],
-                kwargs=task_data.model_dump(exclude=None),
+                args=[[task_id], task_data.model_dump(exclude_unset=True)],
             )
         except Exception as e:
             raise HTTPException(
@@ -239,17 +254,28 @@ class ProjectController:
 
     async def get_task_details(self, task_id: int) -> ProjectTaskSchema:
         """Get specific task details"""
+        if self._use_sql("get_task_details"):
+            try:
+                task = await self.crud.get_task(task_id)
+                if not task:
+                    return {}
+                return self._task_schema(
+                    task, task["project_id"], task["assignees"], task["tags"]
+                )
+            except Exception as err:
+                self.logger.warning(
+                    "SQL read failed, falling back to Odoo",
+                    endpoint="get_task_details",
+                    error=str(err),
+                )
         try:
             # For now, we'll search through projects to find the task
             # Read task details
-            task_fields = list(ProjectTask.model_fields.keys())
+            task_fields = await self._fields(ModelName.TASK, ProjectTask)
             domain = [("id", "=", task_id)]
             kwargs = {"fields": task_fields}
-            task_data = await self.odoo.execute_kw(
-                model=ModelName.TASK,
-                method=Method.SEARCH_READ,
-                args=[domain],
-                kwargs=kwargs,
+            task_data = await query_cache.search_read(
+                self.odoo, ModelName.TASK, domain, **kwargs
             )
             if not task_data:
                 return {}
@@ -316,8 +342,7 @@ class ProjectController:
             return await self.odoo.execute_kw(
                 ModelName.PROJECT,
                 Method.WRITE,
-                args=[project_id],
-                kwargs=project_data.model_dump(exclude_unset=True),
+                args=[[project_id], project_data.model_dump(exclude_unset=True)],
             )
         except Exception as e:
             raise HTTPException(
@@ -329,113 +354,100 @@ class ProjectController:
         """Get tasks for a project"""
         try:
             # Search tasks for this project
-            task_fields = list(ProjectTask.model_fields.keys())
+            task_fields = await self._fields(ModelName.TASK, ProjectTask)
             domain = [("project_id", "=", project_id)]
             kwargs = {"fields": task_fields}
-            project_tasks = await self.odoo.execute_kw(
-                model=ModelName.TASK,
-                method=Method.SEARCH_READ,
-                args=[domain],
-                kwargs=kwargs,
+            project_tasks = await query_cache.search_read(
+                self.odoo, ModelName.TASK, domain, **kwargs
             )
             if not project_tasks:
                 return []
 
-            # Transform tasks to our format
-            transformed_tasks = []
-            for task in project_tasks:
-                # Get assignees
-                assignees = []
-                if task.get("user_ids"):
-                    assignees = [
-                        {
-                            "id": user.id,
-                            "name": user.name,
-                            "email": user.login,
-                        }
-                        for user in await self.get_user(user_ids=task.get("user_ids"))
-                    ]
-
-                # Get tags
-                tags = []
-                if task.get("tag_ids"):
-                    tags = [
-                        tag.name
-                        for tag in await self.get_tag(tag_ids=task.get("tag_ids"))
-                    ]
-
-                # Get blocking tasks
-                blocked_by_task_id = None
-                if task.get("depend_on_ids"):
-                    blocked_by_task_id = (
-                        task["depend_on_ids"][0] if task["depend_on_ids"] else None
-                    )
-
-                transformed_tasks.append(
-                    ProjectTaskSchema(
-                        id=task["id"],
-                        name=task["name"],
-                        project_id=project_id,
-                        status=task["state"],
-                        # "description": task.get("description"),
-                        progress=task.get("progress", 0),
-                        assignees=assignees,
-                        tags=tags,
-                        blocked_by_task_id=blocked_by_task_id,
-                        checklist=[],  # Odoo doesn't have built-in checklist
-                        planned_start=task.get("planned_date_begin"),
-                        planned_stop=task.get("planned_date_end"),
-                        real_duration_seconds=int(
-                            task.get("effective_hours", 0) * 3600
-                        ),
-                        timer_running=task.get("is_timer_running", False),
-                        subtasks=[],  # Would need recursive call for subtasks
-                        files=[],  # Would need to fetch task files
-                    )
-                )
+            return await self._build_tasks(project_tasks, project_id)
+        except Exception as err:
+            self.logger.error("Failed to fetch project tasks", error=str(err))
+            return []
 
-            return transformed_tasks
+    async def _build_tasks(
+        self, tasks: List[Dict], project_id: int
+    ) -> List[ProjectTaskSchema]:
+        """Transform tasks concurrently so the loaders batch every
+        user/tag lookup into one read per model"""
+        try:
+            return list(
+                await asyncio.gather(
+                    *(self._build_task(task, project_id) for task in tasks)
+                )
+            )
         except Exception as err:
             self.logger.error("Failed to fetch project tasks", error=str(err))
             return []
 
+    async def _build_task(self, task: Dict, project_id: int) -> ProjectTaskSchema:
+        """Transform an Odoo task record to our format"""
+        # Get assignees
+        assignees = []
+        if task.get("user_ids"):
+            assignees = [
+                {
+                    "id": user.id,
+                    "name": user.name,
+                    "email": user.login,
+                }
+                for user in await self.get_user(user_ids=task.get("user_ids"))
+            ]
+
+        # Get tags
+        tags = []
+        if task.get("tag_ids"):
+            tags = [tag.name for tag in await self.get_tag(tag_ids=task.get("tag_ids"))]
+
+        return self._task_schema(task, project_id, assignees, tags)
+
+    def _task_schema(
+        self, task: Dict, project_id: int, assignees: List[Dict], tags: List[str]
+    ) -> ProjectTaskSchema:
+        """Build the task schema from a task record and its resolved relations"""
+        # Get blocking tasks
+        blocked_by_task_id = None
+        if task.get("depend_on_ids"):
+            blocked_by_task_id = (
+                task["depend_on_ids"][0] if task["depend_on_ids"] else None
+            )
+
+        return ProjectTaskSchema(
+            id=task["id"],
+            name=task["name"],
+            project_id=project_id,
+            status=task["state"],
+            # "description": task.get("description"),
+            progress=task.get("progress", 0),
+            assignees=assignees,
+            tags=tags,
+            blocked_by_task_id=blocked_by_task_id,
+            checklist=[],  # Odoo doesn't have built-in checklist
+            planned_start=task.get("planned_date_begin"),
+            planned_stop=task.get("planned_date_end"),
+            real_duration_seconds=int((task.get("effective_hours") or 0) * 3600),
+            timer_running=task.get("is_timer_running", False),
+            subtasks=[],  # Would need recursive call for subtasks
+            files=[],  # Would need to fetch task files
+        )
+
     async def _get_project_files(self, project_id: int) -> List[Dict]:
         """Get files for a project"""
         try:
             # Search attachments for this project
-            attachment_fiels = list(Attachment.model_fields.keys())
+            attachment_fiels = await self._fields(ModelName.ATTACHMENT, Attachment)
             domain = [
                 ("res_model", "=", "project.project"),
                 ("res_id", "=", project_id),
             ]
             kwargs = {"fields": attachment_fiels}
-            attachments = await self.odoo.execute_kw(
-                model=ModelName.ATTACHMENT,
-                method=Method.SEARCH_READ,
-                args=[domain],
-                kwargs=kwargs,
+            attachments = await query_cache.search_read(
+                self.odoo, ModelName.ATTACHMENT, domain, **kwargs
             )
-            files = []
-            for attachment in attachments:
-                # Determine category based on mimetype or name
-                category = "other"
-                if "drawing" in attachment["name"].lower():
-                    category = "drawing"
-                elif "material" in attachment["name"].lower():
-                    category = "material_doc"
-                elif "template" in attachment["name"].lower():
-                    category = "template"
-
-                files.append(
-                    {
-                        "id": attachment["id"],
-                        "name": attachment["name"],
-                        "url": f"/api/projects/files/{attachment['id']}/download",
-                        "category": category,
-                        "created_at": attachment["create_date"],
-                    }
-                )
-            return files
+            return [self._build_file(attachment) for attachment in attachments]
 
         except Exception as e:
             self.logger.error(
@@ -443,61 +455,120 @@ class ProjectController:
             )
             return []
 
+    def _build_file(self, attachment: Dict) -> Dict:
+        """Transform an Odoo attachment record to our file format"""
+        # Determine category based on mimetype or name
+        category = "other"
+        if "drawing" in attachment["name"].lower():
+            category = "drawing"
+        elif "material" in attachment["name"].lower():
+            category = "material_doc"
+        elif "template" in attachment["name"].lower():
+            category = "template"
+
+        return {
+            "id": attachment["id"],
+            "name": attachment["name"],
+            "url": f"/api/projects/files/{attachment['id']}/download",
+            "category": category,
+            "created_at": attachment["create_date"],
+        }
+
+    async def _get_project_team(self, project: Dict) -> List[Dict]:
+        """Get team members for a project"""
+        if not project.get("user_ids"):
+            return []
+        return [
+            {
+                "id": user.id,
+                "name": user.name,
+                "email": user.login,
+            }
+            for user in await self.get_user(user_ids=project["user_ids"][0])
+        ]
+
+    def _build_project(
+        self,
+        project: Dict,
+        team: List[Dict],
+        tasks: List[ProjectTaskSchema],
+        files: List[Dict],
+    ) -> ProjectSchema:
+        """Transform an Odoo project record and its children to our format"""
+        return ProjectSchema(
+            id=project["id"],
+            name=project["name"],
+            category=project.get("category_id", [1, "General"])[1],
+            project_color=str(project.get("color", "#000000")),
+            priority=project.get("priority", "normal"),
+            team=team,
+            allocated_hours=project.get("allocated_hours", 0.0),
+            deadline=project.get("date_deadline"),
+            progress=project.get("progress", 0),
+            sales_order=(
+                project.get("sale_order_id", [0, ""])[1]
+                if project.get("sale_order_id")
+                else None
+            ),
+            item_number=project.get("item_number"),
+            description=project.get("description"),
+            tasks=tasks,
+            files=files,
+        )
+
+    def _project_from_sql(self, project: Dict) -> ProjectSchema:
+        """Build the project schema from a repository row with its children"""
+        tasks = [
+            self._task_schema(task, project["id"], task["assignees"], task["tags"])
+            for task in project["tasks"]
+        ]
+        files = [self._build_file(attachment) for attachment in project["files"]]
+        return self._build_project(project, [], tasks, files)
+
+    async def _search_children(
+        self, model: str, domain: list, fields: List[str]
+    ) -> List[Dict]:
+        """Read dashboard child records, degrading to no records on failure"""
+        try:
+            return await query_cache.search_read(self.odoo, model, domain, fields)
+        except Exception as err:
+            self.logger.error(
+                "Failed to fetch dashboard records", model=model, error=str(err)
+            )
+            return []
+
     async def get_project(self, project_id: int) -> ProjectSchema:
         """Get specific project by ID with full details"""
+        if self._use_sql("get_project"):
+            try:
+                project = await self.crud.get_project(project_id)
+                return self._project_from_sql(project) if project else None
+            except Exception as err:
+                self.logger.warning(
+                    "SQL read failed, falling back to Odoo",
+                    endpoint="get_project",
+                    error=str(err),
+                )
         try:
             # Read project details
-            project_fields = list(Project.model_fields.keys())
+            project_fields = await self._fields(ModelName.PROJECT, Project)
             domain = [("id", "=", project_id)]
             kwargs = {"fields": project_fields}
-            project_data = await self.odoo.execute_kw(
-                model=ModelName.PROJECT,
-                method=Method.SEARCH_READ,
-                args=[domain],
-                kwargs=kwargs,
+            project_data = await query_cache.search_read(
+                self.odoo, ModelName.PROJECT, domain, **kwargs
             )
 
             if not project_data:
                 return None
             project = project_data[0]
 
-            # Get team members
-            team = []
-            if project.get("user_ids"):
-                team = [
-                    {
-                        "id": user.id,
-                        "name": user.name,
-                        "email": user.login,
-                    }
-                    for user in await self.get_user(user_ids=project["user_ids"][0])
-                ]
-
-            # Get project tasks
-            tasks = await self._get_project_tasks(project_id)
-
-            # Get project files
-            files = await self._get_project_files(project_id)
-            return ProjectSchema(
-                id=project["id"],
-                name=project["name"],
-                category=project.get("category_id", [1, "General"])[1],
-                project_color=str(project.get("color", "#000000")),
-                priority=project.get("priority", "normal"),
-                team=team,
-                allocated_hours=project.get("allocated_hours", 0.0),
-                deadline=project.get("date_deadline"),
-                progress=project.get("progress", 0),
-                sales_order=(
-                    project.get("sale_order_id", [0, ""])[1]
-                    if project.get("sale_order_id")
-                    else None
-                ),
-                item_number=project.get("item_number"),
-                description=project.get("description"),
-                tasks=tasks,
-                files=files,
+            # Team, tasks and files are independent: fetch them concurrently
+            team, tasks, files = await asyncio.gather(
+                self._bounded(self._get_project_team(project)),
+                self._bounded(self._get_project_tasks(project_id)),
+                self._bounded(self._get_project_files(project_id)),
             )
+            return self._build_project(project, team, tasks, files)
         except Exception as e:
             self.logger.error(
                 "Failed to fetch project", project_id=project_id, error=str(e)
@@ -511,25 +582,71 @@ class ProjectController:
         search: Optional[str] = None,
     ) -> List[ProjectSchema]:
         """Get project dashboard data"""
+        if self._use_sql("get_projects"):
+            try:
+                # One query for the page, its tasks, assignees, tags and files
+                projects = await self.crud.get_projects(skip, limit, search)
+                return [self._project_from_sql(project) for project in projects]
+            except Exception as err:
+                self.logger.warning(
+                    "SQL read failed, falling back to Odoo",
+                    endpoint="get_projects",
+                    error=str(err),
+                )
         try:
             # Get project list for dashboard
             domain = []
             if search:
                 domain = [("name", "ilike", f"%{search}%")]
-            kwargs = {"offset": skip, "limit": limit}
-            project_list = await self.get_project_ids(
-                model=ModelName.PROJECT,
-                method=Method.SEARCH,
-                domain=domain,
-                kwargs=kwargs,
-            )
-            # Get full details for each project
-            full_projects = []
-            for project_id in project_list:
-                full_project = await self.get_project(project_id)
-                if full_project:
-                    full_projects.append(full_project)
-            return full_projects
+            kwargs = {
+                "fields": await self._fields(ModelName.PROJECT, Project),
+                "offset": skip,
+                "limit": limit,
+            }
+            projects = await query_cache.search_read(
+                self.odoo, ModelName.PROJECT, domain, **kwargs
+            )
+            if not projects:
+                return []
+            project_ids = [project["id"] for project in projects]
+
+            # One read each for all tasks and all files of the page
+            project_tasks, attachments = await asyncio.gather(
+                self._search_children(
+                    ModelName.TASK,
+                    [("project_id", "in", project_ids)],
+                    await self._fields(ModelName.TASK, ProjectTask),
+                ),
+                self._search_children(
+                    ModelName.ATTACHMENT,
+                    [
+                        ("res_model", "=", "project.project"),
+                        ("res_id", "in", project_ids),
+                    ],
+                    await self._fields(ModelName.ATTACHMENT, Attachment),
+                ),
+            )
+
+            # Join in memory; users and tags are batched by the loaders
+            tasks_by_project = {project_id: [] for project_id in project_ids}
+            for task in project_tasks:
+                tasks_by_project[task["project_id"][0]].append(task)
+            files_by_project = {project_id: [] for project_id in project_ids}
+            for attachment in attachments:
+                files_by_project[attachment["res_id"]].append(
+                    self._build_file(attachment)
+                )
+
+            async def assemble(project: Dict) -> ProjectSchema:
+                team, tasks = await asyncio.gather(
+                    self._get_project_team(project),
+                    self._build_tasks(tasks_by_project[project["id"]], project["id"]),
+                )
+                return self._build_project(
+                    project, team, tasks, files_by_project[project["id"]]
+                )
+
+            return list(await asyncio.gather(*(assemble(p) for p in projects)))
         except Exception as e:
             self.logger.error("Error : %s", e)
             raise HTTPException(
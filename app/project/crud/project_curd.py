@@ -1,19 +1,111 @@
 import json
 import logging
 from datetime import datetime
-from typing import List, Union
+from typing import Dict, List, Optional, Union
 
 import asyncpg
 
-from app.core.executor import prepare_and_fetch
+from app.config import settings
+from app.core.executor import prepare_and_fetch, prepare_and_fetchrow
 
 _logger = logging.getLogger(__name__)
 
+# Translatable fields are jsonb {lang: value} since Odoo 16
+TRANSLATED = "COALESCE(%(col)s->>$1, %(col)s->>'en_US')"
+
+TASK_JSON = """
+    json_build_object(
+        'id', t.id,
+        'name', t.name,
+        'project_id', t.project_id,
+        'state', t.state,
+        'progress', t.progress,
+        'effective_hours', t.effective_hours,
+        'parent_id', t.parent_id,
+        'assignees', COALESCE((
+            SELECT json_agg(
+                json_build_object('id', u.id, 'name', rp.name, 'email', u.login)
+                ORDER BY u.id
+            )
+            FROM project_task_user_rel rel
+            JOIN res_users u ON u.id = rel.user_id
+            JOIN res_partner rp ON rp.id = u.partner_id
+            WHERE rel.task_id = t.id
+        ), '[]'),
+        'tags', COALESCE((
+            SELECT json_agg(%(tag_name)s ORDER BY g.id)
+            FROM project_tags_project_task_rel rel
+            JOIN project_tags g ON g.id = rel.project_tags_id
+            WHERE rel.project_task_id = t.id
+        ), '[]')
+    )
+""" % {"tag_name": TRANSLATED % {"col": "g.name"}}
+
+# One query for a page of projects with their tasks, assignees, tags and files
+PROJECTS_QUERY = """
+    WITH projects AS (
+        SELECT p.id, %(name)s AS name, p.color, p.allocated_hours, p.sequence
+        FROM project_project p
+        WHERE %%(where)s
+        ORDER BY p.sequence, %(name)s, p.id
+        %%(page)s
+    )
+    SELECT
+        p.id,
+        p.name,
+        p.color,
+        p.allocated_hours,
+        COALESCE((
+            SELECT json_agg(%(task)s ORDER BY t.priority DESC, t.sequence, t.id)
+            FROM project_task t
+            WHERE t.project_id = p.id AND t.active
+        ), '[]') AS tasks,
+        COALESCE((
+            SELECT json_agg(
+                json_build_object(
+                    'id', a.id,
+                    'name', a.name,
+                    'mimetype', a.mimetype,
+                    'create_date', to_char(a.create_date, 'YYYY-MM-DD HH24:MI:SS')
+                )
+                ORDER BY a.id DESC
+            )
+            FROM ir_attachment a
+            WHERE a.res_model = 'project.project' AND a.res_id = p.id
+                AND a.res_field IS NULL
+        ), '[]') AS files
+    FROM projects p
+    ORDER BY p.sequence, p.name, p.id
+""" % {"name": TRANSLATED % {"col": "p.name"}, "task": TASK_JSON}
+
+DASHBOARD_QUERY = PROJECTS_QUERY % {
+    "where": "p.active AND ($4::text IS NULL OR %s ILIKE '%%' || $4::text || '%%')"
+    % (TRANSLATED % {"col": "p.name"}),
+    "page": "OFFSET $2 LIMIT $3",
+}
+
+PROJECT_QUERY = PROJECTS_QUERY % {"where": "p.id = $2", "page": ""}
+
+TASK_QUERY = "SELECT %s AS task FROM project_task t WHERE t.id = $2" % TASK_JSON
+
+def _project(record: asyncpg.Record) -> Dict:
+    project = dict(record)
+    project["tasks"] = json.loads(project["tasks"])
+    project["files"] = json.loads(project["files"])
+    return project
+
 
 class PorjectCrud:
+    """Read-only access to Odoo's project tables
+
+    Reads here skip the Odoo ORM, and with it record rules and computed
+    non-stored fields; endpoints opt in via `ODOO_SQL_READ_ENDPOINTS`.
+    """
+
     def __init__(self, db_connection=None, odoo_connection=None) -> None:
         self.db_connection = db_connection
         self.odoo_connection = odoo_connection
+        self.lang = settings.ODOO_DB_LANG
 
     async def find_task(self, task_id: str) -> List[asyncpg.Record]:
         return await prepare_and_fetch(
@@ -21,3 +113,26 @@ class PorjectCrud:
             "SELECT state,id FROM project_task WHERE id = $1;",
             task_id,
         )
+
+    async def get_projects(
+        self, offset: int = 0, limit: int = 100, search: Optional[str] = None
+    ) -> List[Dict]:
+        """Active projects, each with `tasks` and `files`, in Odoo's project order"""
+        records = await prepare_and_fetch(
+            self.db_connection, DASHBOARD_QUERY, self.lang, offset, limit, search
+        )
+        return [_project(record) for record in records]
+
+    async def get_project(self, project_id: int) -> Optional[Dict]:
+        """One project with its `tasks` and `files`"""
+        record = await prepare_and_fetchrow(
+            self.db_connection, PROJECT_QUERY, self.lang, project_id
+        )
+        return _project(record) if record else None
+
+    async def get_task(self, task_id: int) -> Optional[Dict]:
+        """One task with its `assignees` and `tags`"""
+        record = await prepare_and_fetchrow(
+            self.db_connection, TASK_QUERY, self.lang, task_id
+        )
+        return json.loads(record["task"]) if record else None
@@ -7,7 +7,7 @@ import structlog
 
 from app.auth.models.models import User
 from app.api.models.models import SyncResponse
-from app.odoo.client import OdooClientPool
+from app.odoo.client import OdooClientPool, odoo_pool
 from app.cache.redis_client import redis_client
 from app.config import settings
 
@@ -21,7 +21,7 @@ class BaseService:
     def __init__(self, odoo, db=None, current_user: User = None):
         self.db = db
         self.current_user = current_user
-        self.odoo_pool = OdooClientPool()
+        self.odoo_pool = odoo_pool
         self.odoo = odoo
         self.logger = logger.bind(service=self.__class__.__name__)
 
@@ -0,0 +1,65 @@
+"""Benchmark: pool wait with eager vs lazy request connections
+
+Simulates CONCURRENCY requests shaped like the project endpoints: each one
+waits on Odoo for ODOO_LATENCY_MS and runs a single query. With the eager
+`connection` dependency the request holds a pooled connection the whole time;
+with `lazy_connection` it only checks one out around the query. Reports the
+pool wait recorded by PoolWaitStats and the total wall time.
+
+    python bench_db_lazy_connection.py [dsn] [concurrency] [odoo_latency_ms]
+"""
+
+import asyncio
+import sys
+import time
+
+import asyncpg
+
+from app.config import settings
+from app.core.asyncpg_connect import LazyConnection, PoolWaitStats
+
+POOL_SIZE = 5
+
+
+async def eager_request(pool, stats: PoolWaitStats, latency: float):
+    conn, acquired_at = await stats.acquire(pool)
+    try:
+        await asyncio.sleep(latency)  # the Odoo call
+        await conn.fetchval("SELECT 1")
+    finally:
+        stats.released(acquired_at)
+        await pool.release(conn)
+
+
+async def lazy_request(pool, stats: PoolWaitStats, latency: float):
+    conn = LazyConnection(pool, stats)
+    try:
+        await asyncio.sleep(latency)  # the Odoo call
+        await conn.fetchval("SELECT 1")
+    finally:
+        await conn.release()
+
+
+async def main(dsn: str, concurrency: int, latency: float):
+    pool = await asyncpg.create_pool(dsn, min_size=POOL_SIZE, max_size=POOL_SIZE)
+    try:
+        for name, request in (("eager", eager_request), ("lazy", lazy_request)):
+            stats = PoolWaitStats()
+            started = time.perf_counter()
+            await asyncio.gather(
+                *(request(pool, stats, latency) for _ in range(concurrency))
+            )
+            elapsed = time.perf_counter() - started
+            print(f"{name:6} {elapsed * 1000:8.1f} ms total  pool wait {stats.stats()}")
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            sys.argv[1] if len(sys.argv) > 1 else settings.asyncpg_dsn,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+            (int(sys.argv[3]) if len(sys.argv) > 3 else 200) / 1000,
+        )
+    )
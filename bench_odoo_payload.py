@@ -0,0 +1,103 @@
+"""Benchmark: XML-RPC vs JSON-RPC payload size and decode time for Odoo results
+
+Builds `search_read` results shaped like the project dashboard reads
+(project.project and project.task rows with many2one pairs, many2many id
+lists, dates and html descriptions), encodes them the way Odoo answers on
+/xmlrpc/2/object and /jsonrpc, and times the client-side decode.
+
+    python bench_odoo_payload.py
+"""
+
+import json
+import random
+import timeit
+import xmlrpc.client
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+random.seed(7)
+
+
+def project_rows(count: int) -> list:
+    return [
+        {
+            "id": i,
+            "name": f"Production - Engineering {i}",
+            "color": random.randint(0, 11),
+            "user_id": [random.randint(1, 50), "Mitchell Admin"],
+            "allocated_hours": round(random.uniform(0, 500), 2),
+            "date_deadline": "2025-12-31",
+            "progress": random.randint(0, 100),
+            "sale_order_id": [1000 + i, f"S{1000 + i:05d}"],
+            "user_ids": random.sample(range(1, 200), 6),
+            "write_date": "2025-06-01 10:20:30",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def task_rows(count: int) -> list:
+    return [
+        {
+            "id": i,
+            "name": f"Cut and sew panel batch {i}",
+            "project_id": [i % 40 + 1, f"Production - Engineering {i % 40 + 1}"],
+            "state": random.choice(["01_in_progress", "1_done", "04_waiting_normal"]),
+            "description": "<p>Check drawing revision and material list before start.</p>",
+            "progress": round(random.uniform(0, 100), 1),
+            "user_ids": random.sample(range(1, 200), 3),
+            "tag_ids": random.sample(range(1, 30), 2),
+            "effective_hours": round(random.uniform(0, 40), 2),
+            "parent_id": False,
+            "depend_on_ids": [],
+            "planned_date_begin": "2025-05-01 08:00:00",
+            "date_deadline": "2025-06-15 17:00:00",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def encode_xmlrpc(result) -> bytes:
+    return xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True).encode()
+
+
+def encode_jsonrpc(result) -> bytes:
+    return json.dumps({"jsonrpc": "2.0", "id": 1, "result": result}).encode()
+
+
+def main():
+    datasets = {
+        "40 projects": project_rows(40),
+        "500 tasks": task_rows(500),
+        "5000 tasks": task_rows(5000),
+    }
+    decoders = {
+        "xmlrpc.client": lambda body: xmlrpc.client.loads(body)[0][0],
+        "json": lambda body: json.loads(body)["result"],
+    }
+    if orjson is not None:
+        decoders["orjson"] = lambda body: orjson.loads(body)["result"]
+
+    for name, rows in datasets.items():
+        xml_body = encode_xmlrpc(rows)
+        json_body = encode_jsonrpc(rows)
+        assert decoders["xmlrpc.client"](xml_body) == decoders["json"](json_body)
+
+        print(f"{name}:")
+        print(
+            f"  payload  xml-rpc {len(xml_body) / 1024:9.1f} KiB   "
+            f"json-rpc {len(json_body) / 1024:9.1f} KiB   "
+            f"({len(xml_body) / len(json_body):.1f}x smaller)"
+        )
+        for decoder, loads in decoders.items():
+            body = xml_body if decoder == "xmlrpc.client" else json_body
+            runs = 20
+            seconds = timeit.timeit(lambda: loads(body), number=runs) / runs
+            print(f"  decode   {decoder:<14} {seconds * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
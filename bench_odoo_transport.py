@@ -0,0 +1,117 @@
+"""Benchmark: concurrent Odoo calls per worker, blocking ServerProxy vs aiohttp transport
+
+Starts a fake Odoo XML-RPC endpoint (in its own thread and event loop) that
+answers `execute_kw` after a fixed delay, then fires CONCURRENCY calls from a
+single event loop - the situation of one uvicorn worker - and reports the peak
+number of calls the server saw in flight and the total wall time.
+
+    python bench_odoo_transport.py [concurrency] [latency_ms]
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import xmlrpc.client
+
+from aiohttp import web
+
+from app.config import settings
+from app.odoo.client import OdooClient
+from app.odoo.http_pool import odoo_http_pool
+
+HOST = "127.0.0.1"
+PORT = 8791
+
+
+class FakeOdoo:
+    """Minimal XML-RPC server that tracks in-flight requests"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+
+    def reset(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        params, method = xmlrpc.client.loads(await request.read())
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        result = 2 if method == "authenticate" else [{"id": 1, "name": "Project"}]
+        body = xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True)
+        return web.Response(body=body.encode("utf-8"), content_type="text/xml")
+
+    def serve_forever(self, ready: threading.Event):
+        async def _run():
+            app = web.Application()
+            app.router.add_post("/xmlrpc/2/{service}", self.handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            await web.TCPSite(runner, HOST, PORT).start()
+            ready.set()
+            await asyncio.Event().wait()
+
+        asyncio.run(_run())
+
+
+async def run_blocking(concurrency: int) -> float:
+    """Previous behaviour: ServerProxy called directly inside a coroutine"""
+    proxy = xmlrpc.client.ServerProxy(f"http://{HOST}:{PORT}/xmlrpc/2/object")
+
+    async def call():
+        return proxy.execute_kw("odoo", 2, "admin", "project.project", "search_read", [[]], {})
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+
+async def run_async(concurrency: int) -> float:
+    """Current behaviour: OdooClient over the aiohttp transport"""
+    client = OdooClient(f"http://{HOST}:{PORT}", "odoo", "admin", "admin", uid=2)
+    start = time.perf_counter()
+    # A different domain per call: identical concurrent reads would be
+    # coalesced into one RPC, which is not what this benchmark measures
+    await asyncio.gather(
+        *(
+            client.execute_kw("project.project", "search_read", [[("id", "=", i)]])
+            for i in range(concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    await odoo_http_pool.close()
+    return elapsed
+
+
+def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    latency = (int(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000
+    # Enough keep-alive connections for every call to be in flight at once
+    odoo_http_pool.size = max(odoo_http_pool.size, concurrency)
+    # and no adaptive concurrency limit: the limiter is not what is measured here
+    settings.ODOO_LIMIT_INITIAL = settings.ODOO_LIMIT_MAX = concurrency
+
+    server = FakeOdoo(latency)
+    ready = threading.Event()
+    threading.Thread(target=server.serve_forever, args=(ready,), daemon=True).start()
+    ready.wait()
+
+    print(f"{concurrency} concurrent execute_kw calls, {latency * 1000:.0f} ms Odoo latency")
+    for name, runner in (("blocking ServerProxy", run_blocking), ("aiohttp transport", run_async)):
+        server.reset()
+        elapsed = asyncio.run(runner(concurrency))
+        print(
+            f"  {name:<22} peak in flight: {server.peak:>4}   "
+            f"wall time: {elapsed:6.2f}s   throughput: {concurrency / elapsed:7.1f} req/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark: prepare-per-call vs asyncpg's per-connection statement cache
+
+Runs the same parameterized query ITERATIONS times through a small asyncpg
+pool, acquiring and releasing a connection for every call - like one query per
+request - once with `conn.prepare()` on every call (the old executor) and once
+through `prepare_and_fetch`, which uses the connection's statement cache.
+Reports the wall time of each.
+
+    python bench_pg_statements.py [dsn] [iterations]
+"""
+
+import asyncio
+import sys
+import time
+
+import asyncpg
+
+from app.config import settings
+from app.core.executor import prepare_and_fetch
+
+QUERY = "SELECT n, md5(n::text) FROM generate_series(1, $1::int) AS n"
+
+
+async def prepare_each_call(pool: asyncpg.Pool, iterations: int):
+    for _ in range(iterations):
+        async with pool.acquire() as conn:
+            stmt = await conn.prepare(QUERY)
+            await stmt.fetch(10)
+
+
+async def statement_cache(pool: asyncpg.Pool, iterations: int):
+    for _ in range(iterations):
+        async with pool.acquire() as conn:
+            await prepare_and_fetch(conn, QUERY, 10)
+
+
+async def main(dsn: str, iterations: int):
+    for name, run in (
+        ("prepare each call", prepare_each_call),
+        ("statement cache", statement_cache),
+    ):
+        pool = await asyncpg.create_pool(dsn, min_size=2, max_size=2)
+        try:
+            started = time.perf_counter()
+            await run(pool, iterations)
+            elapsed = time.perf_counter() - started
+            print(
+                f"{name:18} {iterations} calls  {elapsed * 1000:8.1f} ms  "
+                f"{elapsed / iterations * 1e6:7.1f} us/call"
+            )
+        finally:
+            await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            sys.argv[1] if len(sys.argv) > 1 else settings.asyncpg_dsn,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 5000,
+        )
+    )